@@ -16,6 +16,18 @@ TEMPLATE="templates/modern-template.tex"
 CHARTS_DIR="charts"
 ASSETS_DIR="assets"
 
+# Run a command as a named stage; with BUILD_TIMINGS set, its time and peak
+# memory are appended to that JSON-lines file
+run_stage() {
+    local stage="$1"
+    shift
+    if [ -n "$BUILD_TIMINGS" ]; then
+        python3 scripts/instrument.py run "$stage" -- "$@"
+    else
+        "$@"
+    fi
+}
+
 # Check for required tools
 check_dependencies() {
     local missing=()
@@ -72,12 +84,8 @@ img.save('$ASSETS_DIR/logo.png')
 # Generate charts from data
 generate_charts() {
     echo "Generating financial charts..."
-    python3 scripts/generate_charts.py
-
-    # Convert SVGs to PDF if needed
-    if [ -f "scripts/fix_svgs.sh" ]; then
-        bash scripts/fix_svgs.sh
-    fi
+    # Matplotlib writes the PDFs LaTeX includes directly; no SVG round trip
+    run_stage charts python3 scripts/generate_charts.py --formats pdf
 }
 
 # Build PDF with Tufte-LaTeX
@@ -87,12 +95,9 @@ build_pdf() {
     # Use Tufte template (preferred)
     if [ -f "$TUFTE_TEX" ]; then
         echo "Using Tufte-LaTeX design system..."
-        pdflatex -interaction=nonstopmode "$TUFTE_TEX" > /dev/null 2>&1
-        pdflatex -interaction=nonstopmode "$TUFTE_TEX" > /dev/null 2>&1
-        pdflatex -interaction=nonstopmode "$TUFTE_TEX" > /dev/null 2>&1
-
-        if [ -f "business-plan-tufte.pdf" ]; then
-            cp business-plan-tufte.pdf "$OUTPUT_PDF"
+        # Skips unchanged inputs and stops once .aux/.toc settle;
+        # LATEX_FLAGS=--precompile caches the preamble as a format file
+        if python3 scripts/build_latex.py "$TUFTE_TEX" --output "$OUTPUT_PDF" $LATEX_FLAGS; then
             local size=$(du -h "$OUTPUT_PDF" | cut -f1)
             echo "✓ PDF generated successfully: $OUTPUT_PDF ($size)"
         else
@@ -135,6 +140,10 @@ main() {
     echo "✓ Build complete!"
     echo "==================================="
     echo "Output: $OUTPUT_PDF"
+    if [ -n "$BUILD_TIMINGS" ]; then
+        echo ""
+        python3 scripts/instrument.py summary "$BUILD_TIMINGS"
+    fi
     echo ""
 }
 
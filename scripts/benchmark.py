@@ -0,0 +1,843 @@
+#!/usr/bin/env python3
+"""
+Performance benchmarks for the build tooling.
+Generates synthetic inputs and reports throughput for chart generation and
+PDF rebranding.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from contextlib import redirect_stdout
+from io import BytesIO, StringIO
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from instrument import peak_rss_kb
+from synthetic_pdf import PAGE_SIZES
+
+DEFAULT_BRANDING = {
+    'company': 'Anthropic Ventures',
+    'document_type': 'Business Plan',
+    'watermark': True,
+    'watermark_text': 'CONFIDENTIAL',
+    'header': True,
+    'footer': True,
+    'accent_bar': True,
+    'title': 'Business Plan - Anthropic Ventures',
+}
+
+def make_forecast(rows, scenarios=1):
+    """Synthetic quarterly forecast shaped like data/forecast.csv.
+
+    With ``scenarios`` > 1 a long-format table with a Scenario column is
+    returned, ``rows`` periods per scenario.
+    """
+    import numpy as np
+    import pandas as pd
+
+    frames = []
+    for s in range(scenarios):
+        period = np.arange(rows)
+        progress = period / max(rows - 1, 1)
+        scale = 1 + 0.1 * s
+        revenue = np.round(150_000 * 83 ** progress * scale)
+        frame = pd.DataFrame({
+            'Quarter': np.char.add('Q', (period % 4 + 1).astype(str)),
+            'Year': 2025 + period // 4,
+            'Revenue': revenue.astype(int),
+            'Expenses': np.round(450_000 + 1_200_000 * progress).astype(int),
+            'Customers': np.round(revenue / 13_500).astype(int),
+            'ARR': (revenue * 4).astype(int),
+        })
+        if scenarios > 1:
+            frame.insert(0, 'Scenario', f'scenario-{s}')
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+def quiet(func, *args, **kwargs):
+    """Call ``func`` with its progress output suppressed."""
+    with redirect_stdout(StringIO()):
+        return func(*args, **kwargs)
+
+def make_sample_document(path, pages):
+    """Write a ``pages``-page input by repeating the 2-page sample PDF."""
+    from PyPDF2 import PdfReader, PdfWriter
+    from rebrand_pdf import create_sample_pdf
+
+    sample = Path(path).with_suffix('.sample.pdf')
+    quiet(create_sample_pdf, sample)
+    source = PdfReader(sample).pages
+    writer = PdfWriter()
+    for i in range(pages):
+        writer.add_page(source[i % len(source)])
+    with open(path, 'wb') as f:
+        writer.write(f)
+    sample.unlink()
+    return path
+
+def make_scanned_document(path, pages, image_px=256):
+    """Write a ``pages``-page input where every page carries its own image.
+
+    Unlike the repeated sample, no content is shared between pages, so the
+    cost of holding pages in memory grows with the page count like a scan.
+    """
+    from PIL import Image
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.utils import ImageReader
+
+    can = canvas.Canvas(str(path), pagesize=letter)
+    width, height = letter
+    for page in range(pages):
+        noise = Image.frombytes('RGB', (image_px, image_px), os.urandom(image_px * image_px * 3))
+        can.drawImage(ImageReader(noise), 72, 144, width - 144, height - 288)
+        can.drawString(72, 100, f"Scanned page {page + 1}")
+        can.showPage()
+    can.save()
+    return path
+
+def make_object_stream_document(source, path):
+    """Rewrite ``source`` the way pdflatex does: an xref stream plus an object stream.
+
+    Every non-stream object (catalog, page tree, pages, fonts) is packed into
+    one ``/ObjStm`` and the trailer lives in a ``/XRef`` stream, so PyPDF2
+    reads it without a ``/Size`` entry. Object numbers are kept.
+    """
+    from PyPDF2 import PdfReader
+    from PyPDF2.generic import StreamObject
+
+    reader = PdfReader(str(source))
+    numbers = sorted(reader.xref[0])
+    size = max(numbers) + 3
+    objstm, xref_number = size - 2, size - 1
+    out = BytesIO()
+    out.write(b'%PDF-1.5\n%\xe2\xe3\xcf\xd3\n')
+    entries = {0: (0, 0, 65535)}
+
+    packed, header = BytesIO(), []
+    for number in numbers:
+        obj = reader.get_object(number)
+        if isinstance(obj, StreamObject):
+            entries[number] = (1, out.tell(), 0)
+            out.write(f'{number} 0 obj\n'.encode())
+            obj.write_to_stream(out, None)
+            out.write(b'\nendobj\n')
+        else:
+            entries[number] = (2, objstm, len(header))
+            header.append(f'{number} {packed.tell()}')
+            obj.write_to_stream(packed, None)
+            packed.write(b'\n')
+    prefix = (' '.join(header) + '\n').encode()
+    entries[objstm] = (1, out.tell(), 0)
+    out.write(f'{objstm} 0 obj\n<< /Type /ObjStm /N {len(header)} /First {len(prefix)} '
+              f'/Length {len(prefix) + len(packed.getvalue())} >>\nstream\n'.encode())
+    out.write(prefix + packed.getvalue() + b'\nendstream\nendobj\n')
+
+    entries[xref_number] = (1, out.tell(), 0)
+    rows = b''.join(kind.to_bytes(1, 'big') + field.to_bytes(4, 'big') + index.to_bytes(2, 'big')
+                    for kind, field, index in (entries.get(n, (0, 0, 0)) for n in range(size)))
+    root = reader.trailer.raw_get('/Root')
+    out.write(f'{xref_number} 0 obj\n<< /Type /XRef /Size {size} /W [1 4 2] '
+              f'/Root {root.idnum} {root.generation} R /Length {len(rows)} >>\n'
+              f'stream\n'.encode())
+    out.write(rows + b'\nendstream\nendobj\n')
+    out.write(f'startxref\n{entries[xref_number][1]}\n%%EOF\n'.encode())
+    Path(path).write_bytes(out.getvalue())
+    return path
+
+def check_incremental(input_pdf, output_pdf):
+    """Rebrand ``input_pdf`` incrementally and return what is wrong with the result.
+
+    The output must start with the input's bytes, reopen under strict
+    parsing and carry the branding and page label on every page.
+    """
+    from PyPDF2 import PdfReader
+    from rebrand_pdf import rebrand_pdf
+
+    quiet(rebrand_pdf, input_pdf, output_pdf, DEFAULT_BRANDING, incremental=True)
+    problems = []
+    if not output_pdf.read_bytes().startswith(input_pdf.read_bytes()):
+        problems.append("original bytes were not preserved")
+    reader = PdfReader(str(output_pdf), strict=True)
+    total = len(PdfReader(str(input_pdf)).pages)
+    if len(reader.pages) != total:
+        problems.append(f"{len(reader.pages)} pages instead of {total}")
+    for number, page in enumerate(reader.pages, start=1):
+        text = page.extract_text()
+        if DEFAULT_BRANDING['company'] not in text or f'Page {number} of {total}' not in text:
+            problems.append(f"page {number} is missing its branding")
+    return problems
+
+def bench_check_incremental(args):
+    """Check --incremental on an xref-table input and an object-stream input."""
+    from rebrand_pdf import create_sample_pdf
+
+    with tempfile.TemporaryDirectory() as tmp:
+        table = Path(tmp) / 'xref-table.pdf'
+        quiet(create_sample_pdf, table)
+        inputs = {'xref table': table,
+                  'xref stream + object stream':
+                      make_object_stream_document(table, Path(tmp) / 'xref-stream.pdf')}
+        failed = False
+        for label, input_pdf in inputs.items():
+            try:
+                problems = check_incremental(input_pdf, Path(tmp) / 'output.pdf')
+            except Exception as exc:
+                problems = [f"{type(exc).__name__}: {exc}"]
+            for problem in problems:
+                print(f"✗ {label}: {problem}")
+            if not problems:
+                print(f"✓ {label}")
+            failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+# Page geometries cycled through by mixed_document: (width, height, /Rotate)
+MIXED_GEOMETRIES = PAGE_SIZES['mixed']
+
+def mixed_document(pages):
+    """Cached ``pages``-page input cycling through ``MIXED_GEOMETRIES``."""
+    from synthetic_pdf import fixture
+
+    return fixture(pages, sizes='mixed')
+
+PEAK_RSS_SCRIPT = """
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+sys.path.insert(0, {script_dir!r})
+from instrument import peak_rss_kb
+from rebrand_pdf import rebrand_pdf
+with redirect_stdout(StringIO()):
+    rebrand_pdf({input!r}, {output!r}, {branding!r}, stream={stream!r})
+print(peak_rss_kb())
+"""
+
+def peak_rss_mb(input_pdf, output_pdf, stream):
+    """Rebrand in a fresh interpreter and return its peak RSS in MB."""
+    code = PEAK_RSS_SCRIPT.format(script_dir=str(SCRIPT_DIR), input=str(input_pdf),
+                                  output=str(output_pdf), branding=DEFAULT_BRANDING,
+                                  stream=stream)
+    result = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True)
+    return int(result.stdout.split()[-1]) / 1024
+
+def bench_rebrand_memory(args):
+    """Check that streaming rebrand memory stays flat as the page count grows.
+
+    Exits non-zero when the peak RSS for the large input exceeds the small
+    input's by more than ``--tolerance``.
+    """
+    sizes = (args.pages, args.pages * args.scale)
+    modes = (True, False) if args.compare else (True,)
+    with tempfile.TemporaryDirectory() as tmp:
+        peaks = {}
+        print(f"{'mode':>10} {'pages':>8} {'input MB':>10} {'peak RSS MB':>12}")
+        for pages in sizes:
+            input_pdf = make_scanned_document(Path(tmp) / f'scan-{pages}.pdf', pages)
+            input_mb = input_pdf.stat().st_size / (1024 * 1024)
+            for stream in modes:
+                peak = peak_rss_mb(input_pdf, Path(tmp) / 'output.pdf', stream)
+                peaks[stream, pages] = peak
+                mode = 'stream' if stream else 'in-memory'
+                print(f"{mode:>10} {pages:>8} {input_mb:>10.1f} {peak:>12.1f}")
+
+    small, large = peaks[True, sizes[0]], peaks[True, sizes[1]]
+    growth = large / small - 1
+    print(f"\nStreaming peak RSS growth for {args.scale}x pages: {growth:+.1%} "
+          f"(limit {args.tolerance:+.0%})")
+    if growth > args.tolerance:
+        print("✗ Memory regression: streaming peak RSS grows with page count")
+        sys.exit(1)
+    print("✓ Streaming memory is bounded")
+
+def _legacy_prep(df):
+    """The pre-vectorization chart prep: row iteration and Python loops."""
+    from generate_charts import format_currency
+
+    labels = [f"{row['Quarter']}\n{row['Year']}" for _, row in df.iterrows()]
+    profit = df['Revenue'] - df['Expenses']
+    breakeven = next((i for i, p in enumerate(profit) if p > 0), None)
+    values = [format_currency(v, None) for v in df['Revenue']]
+    return labels, breakeven, values
+
+def _vectorized_prep(df):
+    from forecast import currency_labels, derive_series, quarter_labels, scenario_summary
+
+    summary = scenario_summary(derive_series(df))
+    return quarter_labels(df), summary['breakeven_period'], currency_labels(df['Revenue'])
+
+def bench_chart_scale(args):
+    """End-to-end chart time (prep, build and save) and output size as the forecast grows."""
+    from generate_charts import CHARTS, render_chart
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'rows':>8} {'legacy prep':>12} {'vector prep':>12} "
+              + ' '.join(f'{name:>18}' for name in CHARTS) + f" {'output KB':>10}")
+        for rows in args.rows:
+            df = make_forecast(rows)
+            prep = []
+            for func in (_legacy_prep, _vectorized_prep):
+                start = time.perf_counter()
+                func(df)
+                prep.append(time.perf_counter() - start)
+            totals = []
+            for name in CHARTS:
+                start = time.perf_counter()
+                render_chart(name, df, Path(tmp), formats=tuple(args.formats))
+                totals.append(time.perf_counter() - start)
+            size_kb = sum(f.stat().st_size for f in Path(tmp).iterdir()) / 1024
+            print(f"{rows:>8} {prep[0]:>11.3f}s {prep[1]:>11.3f}s "
+                  + ' '.join(f'{seconds:>17.2f}s' for seconds in totals)
+                  + f" {size_kb:>10.0f}")
+
+def bench_chart_templates(args):
+    """Per-chart build and render time for many scenarios: new figures vs. reused templates."""
+    from io import BytesIO
+
+    from forecast import derive_series, iter_scenarios, scenario_summary
+    from generate_charts import CHARTS, _load_plotting, chart_template
+
+    _load_plotting()
+    derived = derive_series(make_forecast(args.rows, args.scenarios))
+    frames = list(iter_scenarios(derived, scenario_summary(derived)))
+
+    print(f"{args.scenarios} scenarios x {args.rows} rows, per chart (build / build + pdf)")
+    print(f"{'chart':<20} {'new figure':>21} {'template':>21} {'build speedup':>14}")
+    for name in CHARTS:
+        template_class, _ = CHARTS[name]
+        # Build the template outside the timing, as a long render run amortizes it
+        chart_template(name)
+        results = []
+        for make_figure in (lambda frame, row: template_class().update(frame, row),
+                            lambda frame, row: chart_template(name).update(frame, row)):
+            build = render = 0.0
+            for _, frame, row in frames:
+                start = time.perf_counter()
+                fig = make_figure(frame, row)
+                build += time.perf_counter() - start
+                fig.savefig(BytesIO(), format='pdf', dpi=300, bbox_inches='tight')
+                render += time.perf_counter() - start
+            results.append((build / len(frames), render / len(frames)))
+        (new_build, new_render), (reuse_build, reuse_render) = results
+        print(f"{name:<20} {new_build * 1000:>8.1f} / {new_render * 1000:>6.1f} ms "
+              f"{reuse_build * 1000:>8.1f} / {reuse_render * 1000:>6.1f} ms "
+              f"{new_build / reuse_build:>13.1f}x")
+
+TEXT_PROFILE_SCRIPT = """
+import cProfile, json, sys
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+sys.path.insert(0, {script_dir!r})
+from forecast import derive_series, iter_scenarios, load_forecast, scenario_summary
+from generate_charts import CHARTS, _load_plotting, render_chart
+_load_plotting()
+derived = derive_series(load_forecast({data!r}))
+frames = list(iter_scenarios(derived, scenario_summary(derived)))
+profiler = cProfile.Profile()
+profiler.enable()
+for _, frame, row in frames:
+    for name in CHARTS:
+        render_chart(name, frame, Path({output!r}), {formats!r}, summary=row,
+                     fixed_layout={fixed_layout!r})
+profiler.disable()
+profiler.create_stats()
+print(json.dumps([[*key, calls, cumulative]
+                  for key, (_, calls, _, cumulative, _) in profiler.stats.items()]))
+"""
+
+# Profile buckets: (matplotlib file, function) pairs whose cumulative time is summed
+TEXT_PROFILE_BUCKETS = {
+    'text layout': [('text.py', '_get_layout')],
+    'font lookup': [('font_manager.py', 'findfont')],
+    'layout passes': [('figure.py', 'tight_layout'), ('figure.py', 'get_tightbbox')],
+}
+
+def text_profile(data, output_dir, formats, fixed_layout):
+    """Render every chart for every scenario in a fresh interpreter under cProfile.
+
+    Returns the total profiled time, the time in each ``TEXT_PROFILE_BUCKETS``
+    entry and the number of figure draws.
+    """
+    code = TEXT_PROFILE_SCRIPT.format(script_dir=str(SCRIPT_DIR), data=str(data),
+                                      output=str(output_dir), formats=tuple(formats),
+                                      fixed_layout=fixed_layout)
+    result = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True)
+    rows = json.loads(result.stdout.splitlines()[-1])
+    profile = {'total': max(cumulative for *_, cumulative in rows)}
+    for bucket, functions in TEXT_PROFILE_BUCKETS.items():
+        profile[bucket] = sum(cumulative for filename, _, function, _, cumulative in rows
+                              if any(filename.endswith(f'matplotlib{os.sep}{name}')
+                                     and function == wanted for name, wanted in functions))
+    profile['draws'] = sum(calls for filename, _, function, calls, _ in rows
+                           if filename.endswith(f'matplotlib{os.sep}figure.py')
+                           and function == 'draw')
+    return profile
+
+def bench_chart_text(args):
+    """Where chart render time goes on text: tight layout vs. --fixed-layout."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data = Path(tmp) / 'forecast.csv'
+        make_forecast(args.rows, args.scenarios).to_csv(data, index=False)
+        charts = args.scenarios * 3
+
+        print(f"{charts} charts ({args.scenarios} scenarios x 3), formats: "
+              f"{' '.join(args.formats)}; seconds under cProfile")
+        print(f"{'mode':>8} {'total':>8} {'text layout':>12} {'font lookup':>12} "
+              f"{'layout passes':>14} {'draws/chart':>12}")
+        results = {}
+        for fixed_layout in (False, True):
+            mode = 'fixed' if fixed_layout else 'tight'
+            profile = results[mode] = text_profile(data, tmp, args.formats, fixed_layout)
+            print(f"{mode:>8} {profile['total']:>8.2f} {profile['text layout']:>12.2f} "
+                  f"{profile['font lookup']:>12.3f} {profile['layout passes']:>14.2f} "
+                  f"{profile['draws'] / charts:>12.1f}")
+        tight, fixed = results['tight'], results['fixed']
+        print(f"\nText layout: {tight['text layout']:.2f}s -> {fixed['text layout']:.2f}s "
+              f"({1 - fixed['text layout'] / tight['text layout']:.0%} less); "
+              f"total {tight['total'] / fixed['total']:.2f}x faster")
+
+def bench_forecast_load(args):
+    """CSV parsing vs. the cached binary copy, loading all columns or one chart's."""
+    import pandas as pd
+
+    import forecast
+    from generate_charts import CHARTS
+
+    # The ARR chart's projection: its own columns plus what the summary needs
+    projected = {forecast.SCENARIO_COLUMN, *forecast.SUMMARY_COLUMNS, *CHARTS['arr_growth'][1]}
+    cache_format = 'parquet' if forecast._has_pyarrow() else 'npy (mmap)'
+    print(f"Binary cache format: {cache_format}")
+    print(f"{'rows':>10} {'CSV MB':>8} {'csv all':>9} {'csv cols':>9} {'convert':>9} "
+          f"{'cache all':>10} {'cache cols':>11} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            csv_path = Path(tmp) / f'forecast-{rows}.csv'
+            make_forecast(rows // args.scenarios, args.scenarios).to_csv(csv_path, index=False)
+
+            def timed(func):
+                start = time.perf_counter()
+                func()
+                return time.perf_counter() - start
+
+            csv_all = timed(lambda: pd.read_csv(csv_path))
+            csv_cols = timed(lambda: pd.read_csv(csv_path, usecols=lambda c: c in projected))
+            convert = timed(lambda: forecast.load_forecast(csv_path))
+            cache_all = timed(lambda: forecast.load_forecast(csv_path))
+            cache_cols = timed(lambda: forecast.load_forecast(csv_path, projected))
+            print(f"{rows:>10} {csv_path.stat().st_size / 1e6:>8.1f} {csv_all:>8.3f}s "
+                  f"{csv_cols:>8.3f}s {convert:>8.3f}s {cache_all:>9.3f}s {cache_cols:>10.3f}s "
+                  f"{csv_all / cache_cols:>7.1f}x")
+
+def bench_rebrand_mixed(args):
+    """Rebrand a deck of mixed page sizes and rotations, cached vs. per-page overlays."""
+    from rebrand_pdf import _overlay_template, rebrand_pdf
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_pdf = mixed_document(args.pages)
+        output_pdf = Path(tmp) / 'output.pdf'
+
+        print(f"Rebranding {args.pages} pages in {len(MIXED_GEOMETRIES)} page geometries")
+        print(f"{'overlays':>10} {'seconds':>10} {'pages/s':>10} {'templates':>10}")
+        for cache_overlays in (True, False):
+            _overlay_template.cache_clear()
+            start = time.perf_counter()
+            quiet(rebrand_pdf, input_pdf, output_pdf, DEFAULT_BRANDING,
+                  cache_overlays=cache_overlays)
+            elapsed = time.perf_counter() - start
+            templates = _overlay_template.cache_info().currsize if cache_overlays else args.pages
+            mode = 'cached' if cache_overlays else 'per-page'
+            print(f"{mode:>10} {elapsed:>10.2f} {args.pages / elapsed:>10.1f} {templates:>10}")
+
+def bench_rebrand_jobs(args):
+    """Measure rebrand_pdf() throughput as the worker count grows."""
+    from rebrand_pdf import rebrand_pdf
+
+    workers = args.workers or sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    with tempfile.TemporaryDirectory() as tmp:
+        input_pdf = make_sample_document(Path(tmp) / 'input.pdf', args.pages)
+        output_pdf = Path(tmp) / 'output.pdf'
+
+        print(f"Rebranding {args.pages} pages ({os.cpu_count()} CPUs available)")
+        print(f"{'jobs':>6} {'seconds':>10} {'pages/s':>10} {'speedup':>9}")
+        baseline = None
+        for jobs in workers:
+            start = time.perf_counter()
+            quiet(rebrand_pdf, input_pdf, output_pdf, DEFAULT_BRANDING, jobs=jobs)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{jobs:>6} {elapsed:>10.2f} {args.pages / elapsed:>10.1f} "
+                  f"{baseline / elapsed:>8.2f}x")
+
+def bench_rebrand_incremental(args):
+    """Merged vs. streamed vs. incremental rebranding of an image-heavy deck."""
+    from synthetic_pdf import fixture
+    from rebrand_pdf import rebrand_pdf
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_pdf = fixture(args.pages, sizes='mixed', images=args.images,
+                            image_px=args.image_px)
+        output_pdf = Path(tmp) / 'output.pdf'
+        input_mb = input_pdf.stat().st_size / 1e6
+
+        print(f"Rebranding {args.pages} pages, {args.images:g} images of "
+              f"{args.image_px}px per page ({input_mb:.1f} MB)")
+        print(f"{'mode':>12} {'seconds':>10} {'cpu s':>10} {'pages/s':>10} {'output MB':>10}")
+        for mode in ('merge', 'stream', 'incremental'):
+            wall, cpu = time.perf_counter(), time.process_time()
+            quiet(rebrand_pdf, input_pdf, output_pdf, DEFAULT_BRANDING,
+                  stream=mode == 'stream', incremental=mode == 'incremental')
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            print(f"{mode:>12} {wall:>10.2f} {cpu:>10.2f} {args.pages / wall:>10.1f} "
+                  f"{output_pdf.stat().st_size / 1e6:>10.1f}")
+
+def bench_rebrand_fanout(args):
+    """One rebrand_pdf.py run per brand vs. a single --brands fan-out run."""
+    from synthetic_pdf import fixture
+
+    companies = [f'Partner {i}' for i in range(args.brands)]
+    with tempfile.TemporaryDirectory() as tmp:
+        input_pdf = fixture(args.pages, sizes='mixed', images=args.images)
+        manifest = Path(tmp) / 'brands.csv'
+        manifest.write_text('company,doc_type,watermark_text\n' + ''.join(
+            f'{company},Partner Plan,{company.upper()}\n' for company in companies))
+        script = [sys.executable, str(SCRIPT_DIR / 'rebrand_pdf.py'), str(input_pdf)]
+
+        def run(argv):
+            start = time.perf_counter()
+            subprocess.run(argv, cwd=tmp, check=True, capture_output=True)
+            return time.perf_counter() - start
+
+        print(f"Rebranding {args.pages} pages for {args.brands} brands "
+              f"({os.cpu_count()} CPUs available)")
+        print(f"{'mode':>12} {'separate':>10} {'fan-out':>10} {'speedup':>9}")
+        for mode, flags in (('merge', []), ('incremental', ['--incremental'])):
+            separate = sum(run(script + flags + ['-o', str(Path(tmp) / f'{i}.pdf'),
+                                                 '--company', company, '--watermark-text',
+                                                 company.upper(), '--doc-type', 'Partner Plan'])
+                           for i, company in enumerate(companies))
+            fanout = run(script + flags + ['--brands', str(manifest), '--output-dir', tmp,
+                                           '--jobs', str(args.jobs)])
+            print(f"{mode:>12} {separate:>9.2f}s {fanout:>9.2f}s {separate / fanout:>8.2f}x")
+
+# Entry point invocations timed by the startup benchmark
+STARTUP_COMMANDS = {
+    'generate_charts --help': ['generate_charts.py', '--help'],
+    'rebrand_pdf --help': ['rebrand_pdf.py', '--help'],
+    'rebrand_pdf --create-sample': ['rebrand_pdf.py', '--create-sample'],
+    'benchmark --help': ['benchmark.py', '--help'],
+}
+
+def parse_importtime(stderr):
+    """Parse ``-X importtime`` output into ``(total_us, {top-level module: cumulative_us})``.
+
+    Top-level imports are the ones the script itself triggered, i.e. module
+    names without nesting indentation.
+    """
+    total, top_level = 0, {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        if not name.startswith('  '):
+            top_level[name.strip()] = int(cumulative_us)
+    return total, top_level
+
+def bench_startup(args):
+    """Interpreter plus import cost of each CLI entry point, via ``python -X importtime``."""
+    print(f"{'entry point':<30} {'wall ms':>8} {'import ms':>10} {'modules':>8}  heaviest imports")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, command in STARTUP_COMMANDS.items():
+            argv = [sys.executable, '-X', 'importtime', str(SCRIPT_DIR / command[0])] + command[1:]
+            runs = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                result = subprocess.run(argv, cwd=tmp, check=True, capture_output=True, text=True)
+                runs.append((time.perf_counter() - start, result.stderr))
+            runs.sort(key=lambda run: run[0])
+            wall, stderr = runs[len(runs) // 2]
+            total, top_level = parse_importtime(stderr)
+            heaviest = sorted(top_level.items(), key=lambda item: -item[1])[:args.top]
+            print(f"{label:<30} {wall * 1000:>8.0f} {total / 1000:>10.1f} "
+                  f"{stderr.count('import time:') - 1:>8}  "
+                  + ', '.join(f"{name} {us / 1000:.0f}" for name, us in heaviest))
+
+# Input sizes per suite scale: forecast rows, sample PDF pages, mixed-size PDF pages
+SUITE_SCALES = {
+    'quick': {'charts': (12, 1000, 10_000), 'rebrand': (2, 100, 1000), 'rebrand-mixed': (100,)},
+    'full': {'charts': (12, 1000, 10_000, 100_000), 'rebrand': (2, 100, 1000, 5000),
+             'rebrand-mixed': (1000,)},
+}
+
+def run_case(args):
+    """Worker for ``suite``: time one case in this fresh process and print JSON."""
+    if args.kind == 'charts':
+        from forecast import load_forecast
+        from generate_charts import CHARTS, _load_plotting, render_chart
+
+        df = load_forecast(args.input)
+        # Import time is tracked by ``startup``; time the rendering only
+        _load_plotting()
+        latencies = {}
+        cpu_start = time.process_time()
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in CHARTS:
+                start = time.perf_counter()
+                render_chart(name, df, Path(tmp), formats=('pdf',))
+                latencies[name] = time.perf_counter() - start
+        seconds, units = sum(latencies.values()), len(latencies)
+    else:
+        from rebrand_pdf import rebrand_pdf
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cpu_start = time.process_time()
+            start = time.perf_counter()
+            quiet(rebrand_pdf, args.input, Path(tmp) / 'output.pdf', DEFAULT_BRANDING)
+            seconds = time.perf_counter() - start
+        latencies, units = {}, args.size
+    print(json.dumps({'seconds': seconds, 'cpu_seconds': time.process_time() - cpu_start,
+                      'throughput': units / seconds,
+                      'latency': latencies, 'peak_rss_mb': peak_rss_kb() / 1024}))
+
+def suite_inputs(scale, tmp):
+    """Prepare every input for ``scale`` once, yielding ``(case, kind, size, path)``.
+
+    Mixed-size decks come from the synthetic fixture cache.
+    """
+    for kind, sizes in SUITE_SCALES[scale].items():
+        for size in sizes:
+            path = Path(tmp) / f'{kind}-{size}'
+            if kind == 'charts':
+                make_forecast(size).to_csv(path.with_suffix('.csv'), index=False)
+                path = path.with_suffix('.csv')
+            elif kind == 'rebrand':
+                make_sample_document(path.with_suffix('.pdf'), size)
+                path = path.with_suffix('.pdf')
+            else:
+                path = mixed_document(size)
+            yield f'{kind}:{size}', kind, size, path
+
+def git_commit():
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=SCRIPT_DIR,
+                            capture_output=True, text=True)
+    return result.stdout.strip() or 'unknown'
+
+def compare_results(results, baseline, threshold, memory_threshold, noise):
+    """Regressions of ``results`` against ``baseline``, as printable strings.
+
+    Time is compared as CPU seconds, which a busy machine inflates far less
+    than wall time (every case is single-process). Regressions smaller than
+    ``noise`` seconds are ignored so that the tiny cases do not fail on jitter.
+    """
+    regressions = []
+    for case, current in results.items():
+        before = baseline.get(case)
+        if before is None:
+            continue
+        key = 'cpu_seconds' if 'cpu_seconds' in before else 'seconds'
+        slower = current[key] / before[key] - 1
+        if slower > threshold and current[key] - before[key] > noise:
+            regressions.append(f"{case}: {before[key]:.3f}s -> {current[key]:.3f}s CPU "
+                               f"({slower:+.0%}, limit {threshold:+.0%})")
+        grown = current['peak_rss_mb'] / before['peak_rss_mb'] - 1
+        if grown > memory_threshold:
+            regressions.append(f"{case}: peak RSS {before['peak_rss_mb']:.1f} -> "
+                               f"{current['peak_rss_mb']:.1f} MB ({grown:+.0%}, "
+                               f"limit {memory_threshold:+.0%})")
+    return regressions
+
+def bench_suite(args):
+    """Run every case at the chosen scale, save JSON results and check for regressions.
+
+    Each case runs ``--repeat`` times in a fresh interpreter (so peak RSS is
+    per case) and keeps the run with the least CPU time.
+    """
+    commit = git_commit()
+    output = args.output or SCRIPT_DIR.parent / 'benchmarks' / f'results-{commit}.json'
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Generating {args.scale} suite inputs...")
+        cases = list(suite_inputs(args.scale, tmp))
+        print(f"{'case':<22} {'seconds':>9} {'CPU s':>9} {'throughput':>16} {'peak RSS MB':>12}")
+        for case, kind, size, path in cases:
+            runs = []
+            for _ in range(args.repeat):
+                result = subprocess.run(
+                    [sys.executable, str(Path(__file__)), 'run-case', kind, str(path),
+                     '--size', str(size)],
+                    check=True, capture_output=True, text=True)
+                runs.append(json.loads(result.stdout.splitlines()[-1]))
+            best = min(runs, key=lambda run: run['cpu_seconds'])
+            best['peak_rss_mb'] = max(run['peak_rss_mb'] for run in runs)
+            results[case] = best
+            unit = 'charts/s' if kind == 'charts' else 'pages/s'
+            print(f"{case:<22} {best['seconds']:>9.3f} {best['cpu_seconds']:>9.3f} "
+                  f"{best['throughput']:>7.1f} {unit:<8} {best['peak_rss_mb']:>12.1f}")
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        'commit': commit,
+        'scale': args.scale,
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'cpus': os.cpu_count(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }, indent=2))
+    print(f"\n✓ Results saved to {output}")
+
+    if not args.baseline:
+        return
+    if not Path(args.baseline).exists():
+        print(f"No baseline at {args.baseline}; skipping comparison")
+        return
+    baseline = json.loads(Path(args.baseline).read_text())
+    regressions = compare_results(results, baseline['results'], args.threshold,
+                                  args.memory_threshold, args.noise)
+    print(f"Compared with {args.baseline} (commit {baseline.get('commit', '?')})")
+    for regression in regressions:
+        print(f"✗ {regression}")
+    if regressions:
+        sys.exit(1)
+    print("✓ No regressions")
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark chart generation and PDF rebranding')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    jobs_parser = subparsers.add_parser('rebrand-jobs',
+                                        help='Rebrand throughput vs. worker count')
+    jobs_parser.add_argument('--pages', type=int, default=1000,
+                             help='Pages in the synthetic input (default: 1000)')
+    jobs_parser.add_argument('--workers', type=int, nargs='+',
+                             help='Worker counts to try (default: 1 2 4 8 and CPU count)')
+    jobs_parser.set_defaults(func=bench_rebrand_jobs)
+
+    mixed_parser = subparsers.add_parser('rebrand-mixed',
+                                         help='Rebrand a mixed-size, rotated deck')
+    mixed_parser.add_argument('--pages', type=int, default=1000,
+                              help='Pages in the synthetic input (default: 1000)')
+    mixed_parser.set_defaults(func=bench_rebrand_mixed)
+
+    incremental_parser = subparsers.add_parser('rebrand-incremental',
+                                               help='Merged vs. incremental rebranding '
+                                                    'of a scanned-style deck')
+    incremental_parser.add_argument('--pages', type=int, default=500,
+                                    help='Pages in the synthetic input (default: 500)')
+    incremental_parser.add_argument('--images', type=float, default=1.0,
+                                    help='Images per page (default: 1)')
+    incremental_parser.add_argument('--image-px', type=int, default=512,
+                                    help='Image width and height in pixels (default: 512)')
+    incremental_parser.set_defaults(func=bench_rebrand_incremental)
+
+    fanout_parser = subparsers.add_parser('rebrand-fanout',
+                                          help='Separate runs per brand vs. one --brands run')
+    fanout_parser.add_argument('--pages', type=int, default=200,
+                               help='Pages in the synthetic input (default: 200)')
+    fanout_parser.add_argument('--images', type=float, default=1.0,
+                               help='Images per page (default: 1)')
+    fanout_parser.add_argument('--brands', type=int, default=8,
+                               help='Branding variants to produce (default: 8)')
+    fanout_parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                               help='Fan-out workers (default: CPU count)')
+    fanout_parser.set_defaults(func=bench_rebrand_fanout)
+
+    check_parser = subparsers.add_parser('check-incremental',
+                                         help='Check --incremental on xref-table and '
+                                              'object-stream inputs')
+    check_parser.set_defaults(func=bench_check_incremental)
+
+    templates_parser = subparsers.add_parser('chart-templates',
+                                             help='New figures vs. reused chart templates')
+    templates_parser.add_argument('--scenarios', type=int, default=20,
+                                  help='Scenarios to render per chart (default: 20)')
+    templates_parser.add_argument('--rows', type=int, default=12,
+                                  help='Forecast rows per scenario (default: 12)')
+    templates_parser.set_defaults(func=bench_chart_templates)
+
+    text_parser = subparsers.add_parser('chart-text',
+                                        help='Text layout time: tight layout vs. --fixed-layout')
+    text_parser.add_argument('--scenarios', type=int, default=5,
+                             help='Scenarios to render (default: 5)')
+    text_parser.add_argument('--rows', type=int, default=12,
+                             help='Forecast rows per scenario (default: 12)')
+    text_parser.add_argument('--formats', nargs='+', default=['pdf', 'svg'],
+                             help='Output formats to save (default: pdf svg)')
+    text_parser.set_defaults(func=bench_chart_text)
+
+    load_parser = subparsers.add_parser('forecast-load',
+                                        help='Forecast load time: CSV vs. cached binary copy')
+    load_parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000],
+                             help='Total rows to try (default: 100000 1000000)')
+    load_parser.add_argument('--scenarios', type=int, default=10,
+                             help='Scenarios the rows are split across (default: 10)')
+    load_parser.set_defaults(func=bench_forecast_load)
+
+    scale_parser = subparsers.add_parser('chart-scale',
+                                         help='Chart prep and render time vs. forecast rows')
+    scale_parser.add_argument('--rows', type=int, nargs='+', default=[12, 1000, 10000],
+                              help='Forecast sizes to try (default: 12 1000 10000)')
+    scale_parser.add_argument('--formats', nargs='+', default=['pdf'],
+                              help='Output formats to save (default: pdf)')
+    scale_parser.set_defaults(func=bench_chart_scale)
+
+    memory_parser = subparsers.add_parser('rebrand-memory',
+                                          help='Peak RSS regression check for --stream')
+    memory_parser.add_argument('--pages', type=int, default=200,
+                               help='Pages in the small input (default: 200)')
+    memory_parser.add_argument('--scale', type=int, default=5,
+                               help='Large input is this many times bigger (default: 5)')
+    memory_parser.add_argument('--tolerance', type=float, default=0.25,
+                               help='Allowed peak RSS growth, as a fraction (default: 0.25)')
+    memory_parser.add_argument('--compare', action='store_true',
+                               help='Also measure the in-memory writer')
+    memory_parser.set_defaults(func=bench_rebrand_memory)
+
+    startup_parser = subparsers.add_parser('startup',
+                                           help='CLI startup and import time per entry point')
+    startup_parser.add_argument('--repeat', type=int, default=5,
+                                help='Runs per entry point; the median is reported (default: 5)')
+    startup_parser.add_argument('--top', type=int, default=4,
+                                help='Heaviest top-level imports to list (default: 4)')
+    startup_parser.set_defaults(func=bench_startup)
+
+    suite_parser = subparsers.add_parser('suite',
+                                         help='Full suite with JSON results and regression check')
+    suite_parser.add_argument('--scale', choices=sorted(SUITE_SCALES), default='quick',
+                              help='Input sizes to run (default: quick)')
+    suite_parser.add_argument('--repeat', type=int, default=3,
+                              help='Runs per case; the fastest is kept (default: 3)')
+    suite_parser.add_argument('--output', type=Path,
+                              help='Results file (default: benchmarks/results-<commit>.json)')
+    suite_parser.add_argument('--baseline', type=Path,
+                              help='Earlier results file to compare against')
+    suite_parser.add_argument('--threshold', type=float, default=0.2,
+                              help='Allowed slowdown per case, as a fraction (default: 0.2)')
+    suite_parser.add_argument('--memory-threshold', type=float, default=0.2,
+                              help='Allowed peak RSS growth, as a fraction (default: 0.2)')
+    suite_parser.add_argument('--noise', type=float, default=0.05,
+                              help='Ignore slowdowns smaller than this many seconds (default: 0.05)')
+    suite_parser.set_defaults(func=bench_suite)
+
+    case_parser = subparsers.add_parser('run-case', help='Run one suite case (used by suite)')
+    case_parser.add_argument('kind', choices=['charts', 'rebrand', 'rebrand-mixed'])
+    case_parser.add_argument('input', type=Path)
+    case_parser.add_argument('--size', type=int, required=True)
+    case_parser.set_defaults(func=run_case)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Incremental LaTeX build for the Tufte business plan.
+Skips the build when no input changed since the last one, reruns pdflatex
+only until the .aux/.toc files stop changing, and can precompile the
+preamble into a format file to shorten every pass.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import instrument
+
+# Files a pass writes and the next pass reads; the build is done once a pass leaves them unchanged
+AUX_SUFFIXES = ('.aux', '.toc', '.lof', '.lot', '.out')
+
+# Local class, package and bibliography style files the document may load
+CLASS_SUFFIXES = ('.cls', '.def', '.sty', '.bst')
+
+# Build state kept next to the .tex file: input hash and format key of the last good build
+STATE_NAME = '.latex-build.json'
+
+def _hash_file(path, digest):
+    digest.update(path.read_bytes())
+
+def latex_inputs(tex):
+    """Every file the build of ``tex`` depends on.
+
+    That is the document itself, the class/package files beside it, the
+    files named by ``\\input``/``\\include``, and everything in the
+    ``\\graphicspath`` directories (charts and assets). Hidden files such as
+    the chart manifest are left out.
+    """
+    root = tex.parent
+    text = tex.read_text()
+    files = {tex}
+    files.update(p for p in root.iterdir() if p.is_file() and p.suffix in CLASS_SUFFIXES)
+
+    for name in re.findall(r'\\(?:input|include)\{([^}]+)\}', text):
+        for candidate in (root / name, root / f'{name}.tex'):
+            if candidate.is_file():
+                files.add(candidate)
+                break
+
+    graphicspath = re.search(r'\\graphicspath\{((?:\{[^}]*\})+)\}', text)
+    for directory in re.findall(r'\{([^}]*)\}', graphicspath.group(1)) if graphicspath else ():
+        directory = root / directory
+        if directory.is_dir():
+            files.update(p for p in directory.rglob('*')
+                         if p.is_file() and not p.name.startswith('.'))
+    return sorted(files)
+
+def inputs_hash(tex, engine):
+    """Fingerprint of the engine and every input file's name and contents."""
+    digest = hashlib.sha256(engine.encode())
+    for path in latex_inputs(tex):
+        digest.update(str(path.relative_to(tex.parent)).encode())
+        _hash_file(path, digest)
+    return digest.hexdigest()
+
+def preamble_key(tex, engine):
+    """Fingerprint of what a precompiled format holds: the preamble and class files."""
+    text = tex.read_text()
+    digest = hashlib.sha256(engine.encode())
+    digest.update(text.split('\\begin{document}', 1)[0].encode())
+    for path in sorted(tex.parent.iterdir()):
+        if path.is_file() and path.suffix in CLASS_SUFFIXES:
+            _hash_file(path, digest)
+    return digest.hexdigest()
+
+def aux_snapshot(tex):
+    """Hashes of the auxiliary files a pass leaves behind (None where absent)."""
+    snapshot = {}
+    for suffix in AUX_SUFFIXES:
+        path = tex.with_suffix(suffix)
+        snapshot[suffix] = hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+    return snapshot
+
+def load_state(tex):
+    path = tex.parent / STATE_NAME
+    if path.exists():
+        try:
+            return json.loads(path.read_text())
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+def save_state(tex, state):
+    (tex.parent / STATE_NAME).write_text(json.dumps(state, indent=2))
+
+def log_errors(tex, limit=10):
+    """The first ``limit`` error lines ("! ...") of the pdflatex log."""
+    log = tex.with_suffix('.log')
+    if not log.exists():
+        return []
+    lines = log.read_text(errors='replace').splitlines()
+    return [line for line in lines if line.startswith('!')][:limit]
+
+def run_latex(stage, command, tex):
+    """Run one engine invocation in the document's directory, output discarded."""
+    return instrument.run_command(stage, command, cwd=tex.parent,
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def build_format(tex, engine, state):
+    """Dump the preamble into ``<name>-preamble.fmt``; returns its name or None.
+
+    Uses the mylatexformat package, so the document itself needs no changes:
+    passes that load the format skip straight to ``\\begin{document}``. The
+    format is reused until the preamble or a class file changes.
+    """
+    name = f'{tex.stem}-preamble'
+    key = preamble_key(tex, engine)
+    if state.get('format') == key and (tex.parent / f'{name}.fmt').exists():
+        return name
+
+    print(f"Precompiling preamble into {name}.fmt...")
+    command = [engine, '-ini', '-interaction=nonstopmode', f'-jobname={name}',
+               f'&{engine}', 'mylatexformat.ltx', tex.name]
+    run_latex('latex_format', command, tex)
+    if not (tex.parent / f'{name}.fmt').exists():
+        print("Warning: could not precompile the preamble (is mylatexformat installed?); "
+              "building without a format")
+        state.pop('format', None)
+        return None
+    state['format'] = key
+    return name
+
+def build_latex(tex, engine='pdflatex', max_passes=5, precompile=False, force=False):
+    """Build ``tex`` to PDF; returns the PDF path, or None if the build failed.
+
+    Nothing runs when the inputs hash matches the last successful build and
+    its PDF still exists. Otherwise passes repeat until one leaves the
+    auxiliary files unchanged, so an edit that moves no page references costs
+    a single pass.
+    """
+    tex = tex.resolve()
+    pdf = tex.with_suffix('.pdf')
+    state = load_state(tex)
+    with instrument.stage('latex_hash'):
+        digest = inputs_hash(tex, engine)
+    if not force and state.get('inputs') == digest and pdf.exists():
+        print(f"✓ {pdf.name} is up to date (inputs unchanged, skipped {engine})")
+        return pdf
+
+    command = [engine, '-interaction=nonstopmode']
+    fmt = build_format(tex, engine, state) if precompile else None
+    if fmt:
+        command.append(f'-fmt={fmt}')
+    command.append(tex.name)
+
+    # A fatal error must not leave the previous PDF looking like this build's
+    pdf.unlink(missing_ok=True)
+    for n in range(1, max_passes + 1):
+        before = aux_snapshot(tex)
+        run_latex(f'{engine}:pass{n}', command, tex)
+        if not pdf.exists():
+            break
+        if aux_snapshot(tex) == before:
+            print(f"✓ {engine} converged after {n} pass{'es' if n > 1 else ''}")
+            break
+    else:
+        print(f"Warning: auxiliary files still changing after {max_passes} passes")
+
+    if not pdf.exists():
+        print(f"✗ {engine} did not produce {pdf.name}")
+        for line in log_errors(tex):
+            print(f"  {line}")
+        return None
+    state['inputs'] = digest
+    save_state(tex, state)
+    return pdf
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a LaTeX document, skipping unneeded passes')
+    parser.add_argument('tex', type=Path, nargs='?', default=Path('business-plan-tufte.tex'),
+                        help='Document to build (default: business-plan-tufte.tex)')
+    parser.add_argument('-o', '--output', type=Path,
+                        help='Copy the finished PDF here')
+    parser.add_argument('--engine', default='pdflatex',
+                        help='LaTeX engine (default: pdflatex)')
+    parser.add_argument('--max-passes', type=int, default=5,
+                        help='Give up converging after this many passes (default: 5)')
+    parser.add_argument('--precompile', action='store_true',
+                        help='Precompile the preamble into a format file (needs mylatexformat)')
+    parser.add_argument('--force', action='store_true',
+                        help='Build even if no input changed')
+    parser.add_argument('--timings', metavar='FILE',
+                        help='Append per-pass timings as JSON lines (default: $BUILD_TIMINGS)')
+    args = parser.parse_args()
+    if args.timings:
+        instrument.configure(args.timings)
+
+    if shutil.which(args.engine) is None:
+        print(f"✗ {args.engine} not found")
+        sys.exit(1)
+
+    with instrument.stage('latex_build'):
+        pdf = build_latex(args.tex, args.engine, args.max_passes, args.precompile, args.force)
+    if pdf is None:
+        sys.exit(1)
+    if args.output and args.output.resolve() != pdf:
+        shutil.copyfile(pdf, args.output)
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,20 @@
 #!/bin/bash
 # Convert SVG charts to PDF format for LaTeX inclusion
-# Uses Inkscape or Cairo for high-quality conversion
+# Only needed for hand-made SVGs: generate_charts.py writes chart PDFs directly.
+# Uses CairoSVG in-process, or Inkscape/rsvg-convert per file as a fallback
 
 set -e
 
-CHARTS_DIR="charts"
+CHARTS_DIR="${1:-charts}"
 
 echo "Converting SVG charts to PDF..."
 
+# Batch conversion in one Python process when the cairosvg module is available
+if python3 -c "import cairosvg" 2>/dev/null; then
+    python3 "$(dirname "$0")/generate_charts.py" --convert-svgs "$CHARTS_DIR"
+    exit 0
+fi
+
 # Check for available conversion tools
 if command -v inkscape &> /dev/null; then
     CONVERTER="inkscape"
@@ -28,6 +35,12 @@ fi
 for svg_file in "$CHARTS_DIR"/*.svg; do
     if [ -f "$svg_file" ]; then
         pdf_file="${svg_file%.svg}.pdf"
+
+        # Skip charts whose PDF is already newer than the SVG (unchanged chart)
+        if [ -f "$pdf_file" ] && [ ! "$svg_file" -nt "$pdf_file" ]; then
+            continue
+        fi
+
         echo "  Converting $(basename "$svg_file") -> $(basename "$pdf_file")"
 
         case $CONVERTER in
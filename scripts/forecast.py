@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Forecast data layer.
+Loads forecast tables and derives the series the charts need (profit,
+breakeven, ARR milestones, growth) with whole-column operations, across any
+number of scenarios at once.
+
+pandas and NumPy are imported inside the functions that use them, so callers
+that only need the constants (or a fast ``--help``) do not pay for them.
+"""
+
+import re
+from pathlib import Path
+
+# Long-format scenario tables carry one row per (scenario, period)
+SCENARIO_COLUMN = 'Scenario'
+DEFAULT_SCENARIO = 'base'
+
+# ARR levels annotated on the ARR growth chart
+ARR_MILESTONES = (1_000_000, 10_000_000, 50_000_000)
+
+def milestone_column(threshold):
+    """Summary column holding the first period ARR reaches ``threshold``."""
+    return f'arr_crossing_{threshold}'
+
+def milestone_label(threshold):
+    """Short currency label for a milestone, e.g. ``$10M``."""
+    if threshold >= 1_000_000:
+        return f'${threshold / 1_000_000:g}M'
+    return f'${threshold / 1_000:g}K'
+
+def scenario_slug(name):
+    """Filesystem-safe directory name for a scenario."""
+    return re.sub(r'[^A-Za-z0-9_.-]+', '-', str(name)).strip('-') or DEFAULT_SCENARIO
+
+# Columns derive_series and scenario_summary read, whatever charts are drawn
+SUMMARY_COLUMNS = ('Quarter', 'Year', 'Revenue', 'Expenses', 'ARR')
+
+# CSVs at least this large get a binary copy cached beside them on first read;
+# smaller ones parse faster than the cache can be checked and loaded
+CACHE_MIN_BYTES = 1_000_000
+
+def _cache_dir(csv_path):
+    """Hidden directory beside the CSV holding its binary copy."""
+    return csv_path.with_name(f'.{csv_path.name}.cache')
+
+def _csv_stamp(csv_path):
+    stat = csv_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+def _has_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+def _present(columns, available):
+    """``columns`` (all when None) that exist in ``available``, in table order."""
+    if columns is None:
+        return list(available)
+    return [column for column in available if column in set(columns)]
+
+def _read_npy_cache(cache, meta, columns):
+    import numpy as np
+    import pandas as pd
+
+    wanted = _present(columns, meta['columns'])
+    return pd.DataFrame({column: np.load(cache / f'col{meta["columns"].index(column)}.npy',
+                                         mmap_mode='r')
+                         for column in wanted})
+
+def _write_cache(df, csv_path):
+    """Store ``df`` as Parquet (with pyarrow) or one .npy file per column.
+
+    Returns False when a column cannot be stored without pickling (text with
+    missing values in the NumPy format). The directory is written under a
+    temporary name and renamed, so a reader never sees half a cache.
+    """
+    import json
+    import shutil
+    import tempfile
+
+    import numpy as np
+
+    cache = _cache_dir(csv_path)
+    meta = {'source': _csv_stamp(csv_path), 'columns': list(df.columns)}
+    tmp = Path(tempfile.mkdtemp(prefix=cache.name, dir=csv_path.parent))
+    try:
+        if _has_pyarrow():
+            meta['format'] = 'parquet'
+            df.to_parquet(tmp / 'forecast.parquet', index=False)
+        else:
+            meta['format'] = 'npy'
+            for i, column in enumerate(df.columns):
+                series = df[column]
+                if series.dtype.kind in 'biuf':
+                    values = series.to_numpy()
+                elif series.isna().any():
+                    return False
+                else:
+                    values = series.to_numpy(dtype=str)
+                np.save(tmp / f'col{i}.npy', values, allow_pickle=False)
+        (tmp / 'meta.json').write_text(json.dumps(meta))
+        shutil.rmtree(cache, ignore_errors=True)
+        tmp.rename(cache)
+        tmp = None
+        return True
+    finally:
+        if tmp is not None:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+def _read_cached_csv(csv_path, columns):
+    """Load ``csv_path`` through its binary cache, converting it on first read."""
+    import json
+
+    import pandas as pd
+
+    cache = _cache_dir(csv_path)
+    try:
+        meta = json.loads((cache / 'meta.json').read_text())
+    except (OSError, ValueError):
+        meta = None
+    if meta and meta['source'] == _csv_stamp(csv_path):
+        if meta['format'] == 'npy':
+            return _read_npy_cache(cache, meta, columns)
+        if _has_pyarrow():
+            return pd.read_parquet(cache / 'forecast.parquet',
+                                   columns=_present(columns, meta['columns']))
+
+    df = pd.read_csv(csv_path)
+    try:
+        _write_cache(df, csv_path)
+    except OSError:
+        # A read-only data directory just means no cache
+        pass
+    return df[_present(columns, df.columns)]
+
+def load_forecast(path, columns=None):
+    """Read a forecast table from CSV, Parquet, Feather or NPZ.
+
+    ``columns`` limits the load to those columns (ones the file lacks, such
+    as ``Scenario``, are ignored); the binary formats then never read the
+    rest. Large CSVs are converted on first read to a binary copy beside them
+    (Parquet when pyarrow is installed, otherwise memory-mapped NumPy
+    arrays), which later loads use until the CSV changes.
+    """
+    import pandas as pd
+
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.parquet':
+        import pyarrow.parquet as pq
+        return pd.read_parquet(path, columns=_present(columns, pq.read_schema(path).names))
+    if suffix in ('.feather', '.arrow'):
+        import pyarrow.feather as feather
+        table = feather.read_table(path, memory_map=True)
+        return table.select(_present(columns, table.column_names)).to_pandas()
+    if suffix == '.npz':
+        import numpy as np
+        # Members of an .npz are only decompressed when accessed
+        with np.load(path, allow_pickle=False) as arrays:
+            return pd.DataFrame({column: arrays[column]
+                                 for column in _present(columns, arrays.files)})
+    if path.stat().st_size >= CACHE_MIN_BYTES:
+        return _read_cached_csv(path, columns)
+    if columns is None:
+        return pd.read_csv(path)
+    wanted = set(columns)
+    return pd.read_csv(path, usecols=lambda column: column in wanted)
+
+def quarter_labels(df):
+    """Two-line tick labels (``Q1\\n2025``) for every row in one array operation."""
+    return (df['Quarter'].astype(str) + '\n' + df['Year'].astype(str)).tolist()
+
+def currency_labels(values):
+    """Format a whole array as ``$12.5M`` / ``$350K`` / ``$900`` labels.
+
+    Matches ``generate_charts.format_currency`` element for element.
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=float)
+    return np.select(
+        [values >= 1_000_000, values >= 1_000],
+        [np.char.mod('$%.1fM', values / 1_000_000),
+         np.char.mod('$%.0fK', values / 1_000)],
+        np.char.mod('$%.0f', values),
+    ).tolist()
+
+def derive_series(df):
+    """Add per-row derived columns for every scenario at once.
+
+    Returns a copy with a ``Scenario`` column (``base`` when the input has
+    none), the ``Period`` index of each row within its scenario, and
+    ``Profit``.
+    """
+    df = df.copy()
+    if SCENARIO_COLUMN not in df:
+        df[SCENARIO_COLUMN] = DEFAULT_SCENARIO
+    df['Period'] = df.groupby(SCENARIO_COLUMN, sort=False).cumcount()
+    df['Profit'] = df['Revenue'] - df['Expenses']
+    return df
+
+def scenario_summary(df):
+    """Summarize each scenario of a ``derive_series`` frame in one pass.
+
+    One row per scenario, indexed by scenario name, with:
+
+    - ``breakeven_period``: first period with positive profit (NaN if never)
+    - ``milestone_column(t)``: first period with ARR >= t (NaN if never)
+    - ``revenue_growth``: last year's revenue over the first year's
+    - ``years``: number of distinct years covered
+    - ``final_arr`` and ``final_label`` (e.g. ``Q4 2027``) of the last period
+    """
+    import numpy as np
+    import pandas as pd
+
+    groups = df.groupby(SCENARIO_COLUMN, sort=False)
+    period = df['Period'].to_numpy(dtype=float)
+
+    crossings = {'breakeven_period': np.where(df['Profit'].to_numpy() > 0, period, np.nan)}
+    thresholds = np.asarray(ARR_MILESTONES, dtype=float)
+    reached = df['ARR'].to_numpy(dtype=float)[:, None] >= thresholds[None, :]
+    crossed_at = np.where(reached, period[:, None], np.nan)
+    for i, threshold in enumerate(ARR_MILESTONES):
+        crossings[milestone_column(threshold)] = crossed_at[:, i]
+    summary = (pd.DataFrame(crossings, index=df.index)
+               .groupby(df[SCENARIO_COLUMN], sort=False).min())
+
+    annual = df.groupby([SCENARIO_COLUMN, 'Year'], sort=False)['Revenue'].sum()
+    by_year = annual.groupby(level=0, sort=False)
+    summary['revenue_growth'] = by_year.last() / by_year.first()
+    summary['years'] = by_year.size()
+
+    last = groups.tail(1).set_index(SCENARIO_COLUMN)
+    summary['final_arr'] = last['ARR']
+    summary['final_label'] = last['Quarter'].astype(str) + ' ' + last['Year'].astype(str)
+    return summary
+
+# Aggregation used when consecutive periods are merged into one bucket
+FLOW_COLUMNS = ('Revenue', 'Expenses', 'Profit')
+STOCK_COLUMNS = ('Customers', 'ARR')
+
+def bucket_periods(df, max_buckets):
+    """Merge consecutive periods so at most ``max_buckets`` rows remain.
+
+    Flows (revenue, expenses, profit) are averaged over each bucket so bars stay
+    per-period amounts even when the last bucket is short; stocks (customers,
+    ARR) keep their last value and labels keep the first period's.
+    Returns ``(frame, bucket_size)``; the frame is returned unchanged when it
+    already fits.
+    """
+    import numpy as np
+
+    size = -(-len(df) // max_buckets)
+    if size <= 1:
+        return df, 1
+    agg = {column: 'mean' for column in FLOW_COLUMNS if column in df}
+    agg.update({column: 'last' for column in STOCK_COLUMNS if column in df})
+    agg.update({column: 'first' for column in ('Quarter', 'Year') if column in df})
+    key = np.arange(len(df)) // size
+    return df.groupby(key).agg(agg).reset_index(drop=True), size
+
+def lttb(x, y, threshold):
+    """Indices of ``threshold`` points picked by Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point and, from each bucket in between, the point
+    forming the largest triangle with the previous pick and the next bucket's
+    mean, which preserves peaks, troughs and the overall shape of the line.
+    """
+    import numpy as np
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Bucket i spans edges[i]:edges[i + 1]; the final "bucket" is the last point
+    edges = np.append(np.linspace(1, n - 1, threshold - 1).astype(int), n)
+    picks = np.empty(threshold, dtype=int)
+    picks[0], picks[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, stop, next_stop = edges[i], edges[i + 1], edges[i + 2]
+        avg_x = x[stop:next_stop].mean()
+        avg_y = y[stop:next_stop].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:stop] - y[a])
+                      - (x[a] - x[start:stop]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        picks[i + 1] = a
+    return picks
+
+def iter_scenarios(df, summary):
+    """Yield ``(scenario, frame, summary_row)`` for each scenario in order."""
+    for scenario, frame in df.groupby(SCENARIO_COLUMN, sort=False):
+        yield scenario, frame.reset_index(drop=True), summary.loc[scenario]
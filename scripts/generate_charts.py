@@ -4,12 +4,20 @@ Generate modern, visually striking financial charts.
 Anthropic-inspired with gradient colors and clean design.
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, Rectangle
+import argparse
+import hashlib
+import inspect
+import json
+import time
+from abc import ABC, abstractmethod
 from pathlib import Path
-import numpy as np
+
+import forecast
+import instrument
+from forecast import (ARR_MILESTONES, SCENARIO_COLUMN, SUMMARY_COLUMNS, bucket_periods,
+                      currency_labels, derive_series, iter_scenarios, load_forecast, lttb,
+                      milestone_column, milestone_label, quarter_labels, scenario_slug,
+                      scenario_summary)
 
 # Modern color palette
 COLORS = {
@@ -21,25 +29,58 @@ COLORS = {
     'white': '#FFFFFF'
 }
 
-# Configure matplotlib for modern output
-plt.rcParams['font.family'] = 'sans-serif'
-plt.rcParams['font.sans-serif'] = ['Inter', 'DejaVu Sans', 'Arial']
-plt.rcParams['font.size'] = 11
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['axes.titlesize'] = 16
-plt.rcParams['axes.titleweight'] = 'bold'
-plt.rcParams['xtick.labelsize'] = 10
-plt.rcParams['ytick.labelsize'] = 10
-plt.rcParams['legend.fontsize'] = 10
-plt.rcParams['figure.titlesize'] = 18
-plt.rcParams['axes.spines.top'] = False
-plt.rcParams['axes.spines.right'] = False
-plt.rcParams['axes.edgecolor'] = COLORS['grey']
-plt.rcParams['xtick.color'] = COLORS['grey']
-plt.rcParams['ytick.color'] = COLORS['grey']
-plt.rcParams['text.color'] = COLORS['navy']
-plt.rcParams['axes.facecolor'] = COLORS['white']
-plt.rcParams['figure.facecolor'] = COLORS['white']
+# Matplotlib style sheet for modern output, applied when plotting first starts
+STYLE_SHEET = Path(__file__).with_name('charts.mplstyle')
+
+def _load_plotting():
+    """Import NumPy, pandas and Matplotlib on first use.
+
+    Keeps ``--help``, ``--convert-svgs`` and up-to-date builds from paying for
+    Matplotlib. Selects the non-interactive Agg backend and loads the style
+    sheet before any figure exists; the names are bound at module level so
+    the chart builders use them as ordinary globals.
+    """
+    global np, pd, matplotlib, Figure, Line2D, Patch, FuncFormatter, PolyCollection, AxesImage
+    global Bbox
+    if 'Figure' in globals():
+        return
+    import numpy as np
+    import pandas as pd
+    import matplotlib
+    import matplotlib.style
+    matplotlib.use('Agg')
+    matplotlib.style.use(STYLE_SHEET)
+    from matplotlib.collections import PolyCollection
+    from matplotlib.figure import Figure
+    from matplotlib.image import AxesImage
+    from matplotlib.lines import Line2D
+    from matplotlib.patches import Patch
+    from matplotlib.ticker import FuncFormatter
+    from matplotlib.transforms import Bbox
+
+def new_figure():
+    """Create an empty chart figure (and load Matplotlib if needed)."""
+    _load_plotting()
+    return Figure(figsize=(12, 6), facecolor=COLORS['white'])
+
+# Formats written for every chart unless --formats narrows them
+OUTPUT_FORMATS = ('pdf', 'svg')
+
+# Large-data mode: long series are reduced to what the chart can actually show
+MAX_BARS = 48          # bar charts aggregate consecutive periods beyond this many bars
+MARKER_LIMIT = 60      # per-point markers are dropped above this many points
+LABEL_LIMIT = 24       # per-bar value labels are dropped above this many bars
+MAX_TICK_LABELS = 16   # x-axis labels are thinned to at most this many
+
+# Saved area of every chart in inches, for --fixed-layout: the tight bounding
+# box the templates get on the 12x6 figure, plus savefig's default 0.1in pad
+FIXED_BBOX = (0.065, 0.065, 11.935, 5.921)
+
+# (weight, style) of the text the chart templates draw
+TEXT_STYLES = (('normal', 'normal'), ('bold', 'normal'), ('normal', 'italic'))
+
+# Build manifest recording the fingerprint each chart was last rendered from
+MANIFEST_NAME = '.chart-manifest.json'
 
 def format_currency(value, pos=None):
     """Format large numbers as currency with K/M suffix."""
@@ -52,7 +93,21 @@ def format_currency(value, pos=None):
 
 def create_quarter_labels(df):
     """Create readable quarter labels."""
-    return [f"{row['Quarter']}\n{row['Year']}" for _, row in df.iterrows()]
+    return quarter_labels(df)
+
+def line_resolution(fig):
+    """Horizontal pixel count of a figure, the most points a line can show."""
+    return int(fig.get_figwidth() * fig.dpi)
+
+def point_marker(marker, points):
+    """``marker`` for short series, none once points would blur together."""
+    return marker if points <= MARKER_LIMIT else None
+
+def set_period_ticks(ax, x, labels):
+    """Label every period, or an evenly spaced subset on long series."""
+    step = -(-len(x) // MAX_TICK_LABELS)
+    ax.set_xticks(x[::step])
+    ax.set_xticklabels(labels[::step], fontsize=10, color=COLORS['grey'])
 
 def add_gradient_background(ax, color1, color2):
     """Add subtle gradient background."""
@@ -60,254 +115,609 @@ def add_gradient_background(ax, color1, color2):
     gradient = np.hstack((gradient, gradient))
     ax.imshow(gradient, extent=[ax.get_xlim()[0], ax.get_xlim()[1],
                                  ax.get_ylim()[0], ax.get_ylim()[1]],
-              aspect='auto', cmap=plt.cm.Blues, alpha=0.03, zorder=0)
+              aspect='auto', cmap=matplotlib.colormaps['Blues'], alpha=0.03, zorder=0)
+
+def warm_fonts():
+    """Resolve the style sheet's font fallback once and preload the chart fonts.
+
+    ``font.sans-serif`` is pinned to the family that was actually found, so
+    later lookups skip missing entries such as ``Inter``, and the font file
+    for each of ``TEXT_STYLES`` is opened before the first figure is drawn.
+    Repeat calls are cheap, as Matplotlib caches both lookups.
+    """
+    _load_plotting()
+    from matplotlib import font_manager
+
+    regular = font_manager.findfont(font_manager.FontProperties(family=['sans-serif']))
+    matplotlib.rcParams['font.sans-serif'] = [font_manager.get_font(regular).family_name]
+    for weight, style in TEXT_STYLES:
+        font_manager.get_font(font_manager.findfont(
+            font_manager.FontProperties(family=['sans-serif'], weight=weight, style=style)))
+
+def rasterize_heavy_artists(fig):
+    """Render fills and images as embedded bitmaps, keeping text and lines vector."""
+    _load_plotting()
+    dense = (PolyCollection, AxesImage)
+    for artist in fig.findobj(lambda artist: isinstance(artist, dense)):
+        artist.set_rasterized(True)
+
+def convert_svgs(svg_paths):
+    """Convert SVGs to PDFs in this process, skipping PDFs already newer.
+
+    Uses CairoSVG as a library, so a whole batch costs one interpreter rather
+    than one converter launch per file. Returns the PDFs written.
+    """
+    import cairosvg
+
+    written = []
+    for svg in map(Path, svg_paths):
+        pdf = svg.with_suffix('.pdf')
+        if pdf.exists() and pdf.stat().st_mtime >= svg.stat().st_mtime:
+            continue
+        with instrument.stage('svg_convert', file=svg.name):
+            cairosvg.svg2pdf(url=str(svg), write_to=str(pdf))
+        written.append(pdf)
+    return written
+
+def save_chart(fig, name, output_dir, formats=OUTPUT_FORMATS, fixed_layout=False):
+    """Write a chart figure in each of ``formats``.
+
+    A tight bounding box makes ``savefig`` draw the figure twice; with
+    ``fixed_layout`` the saved area is ``FIXED_BBOX`` and each format is a
+    single draw.
+    """
+    bbox = Bbox.from_extents(*FIXED_BBOX) if fixed_layout else 'tight'
+    for fmt in formats:
+        fig.savefig(output_dir / f'{name}.{fmt}', dpi=300, bbox_inches=bbox,
+                    facecolor=COLORS['white'])
+
+def summarize(df, summary=None):
+    """Return the scenario summary row for a single-scenario frame."""
+    if summary is not None:
+        return summary
+    return scenario_summary(derive_series(df)).iloc[0]
+
+class ChartTemplate(ABC):
+    """A chart figure whose static scaffolding is built once and reused.
+
+    ``scaffold`` draws what every dataset shares: axes and twin axes, titles,
+    axis labels, grid and tick formatters. ``update`` swaps in one dataset's
+    artists (bars, lines, fills, value labels, annotations) and re-runs the
+    layout, so rendering the same chart for many scenarios reuses a single
+    figure instead of building each from scratch.
+
+    ``LAYOUT`` holds the subplot margins ``tight_layout`` settles on for the
+    template, which a fixed-layout update applies without measuring any text.
+    """
+
+    LAYOUT = None
+
+    def __init__(self):
+        self.fig = new_figure()
+        self.fig.patch.set_facecolor(COLORS['white'])
+        self._artists = []
+        self._legend_key = None
+        params = self.fig.subplotpars
+        self._default_layout = {side: getattr(params, side)
+                                for side in ('left', 'bottom', 'right', 'top')}
+        self.scaffold()
+
+    @abstractmethod
+    def scaffold(self):
+        """Build the axes and static elements shared by every dataset."""
+
+    @abstractmethod
+    def draw(self, df, summary):
+        """Add one dataset's artists to the scaffold."""
+
+    def add(self, artists):
+        """Mark ``artists`` (one or a list) as data, removed by the next update."""
+        self._artists.extend(artists if isinstance(artists, list) else [artists])
+        return artists
+
+    def legend(self, ax, key, handles):
+        """Draw the legend from ``handles()``, only when ``key`` differs from last time."""
+        if key != self._legend_key:
+            self._legend_key = key
+            ax.legend(handles=handles(), loc='upper left', frameon=True,
+                      fancybox=True, shadow=True, fontsize=11)
+
+    def update(self, df, summary=None, fixed_layout=False):
+        """Draw ``df`` into the figure, replacing the previous dataset, and return it."""
+        summary = summarize(df, summary)
+        for artist in self._artists:
+            artist.remove()
+        self._artists = []
+        # Data limits and autoscaling then follow only the new dataset's artists
+        for ax in self.fig.axes:
+            ax.relim()
+        self.draw(df, summary)
+        if fixed_layout:
+            self.fig.subplots_adjust(**self.LAYOUT)
+        else:
+            # tight_layout adjusts from the current layout; start where a new figure would
+            self.fig.subplots_adjust(**self._default_layout)
+            self.fig.tight_layout()
+        return self.fig
+
+class RevenueForecastChart(ChartTemplate):
+    """Revenue forecast with gradient bars and the customer line."""
+
+    LAYOUT = dict(left=0.085, bottom=0.139, right=0.936, top=0.879)
+
+    def scaffold(self):
+        ax1 = self.ax1 = self.fig.subplots()
+        ax1.set_xlabel('Quarter', fontweight='bold', color=COLORS['navy'], fontsize=13)
+        ax1.set_ylabel('Revenue', fontweight='bold', color=COLORS['primary_blue'], fontsize=13)
+        ax1.tick_params(axis='y', labelcolor=COLORS['primary_blue'])
+        ax1.yaxis.set_major_formatter(FuncFormatter(format_currency))
+
+        # Customer line on secondary axis
+        ax2 = self.ax2 = ax1.twinx()
+        ax2.set_ylabel('Customers', fontweight='bold', color=COLORS['light_blue'], fontsize=13)
+        ax2.tick_params(axis='y', labelcolor=COLORS['light_blue'])
+        ax2.spines['right'].set_visible(False)
+
+        # Title with styled box
+        ax1.text(0.5, 1.08, 'Revenue Growth & Customer Acquisition', transform=ax1.transAxes,
+                 fontsize=18, fontweight='bold', ha='center', color=COLORS['navy'])
+        self.subtitle = ax1.text(0.5, 1.03, '', transform=ax1.transAxes,
+                                 fontsize=12, ha='center', color=COLORS['grey'], style='italic')
+
+        # Grid
+        ax1.grid(axis='y', alpha=0.15, linestyle='-', color=COLORS['grey'], linewidth=0.8, zorder=1)
+        ax1.set_axisbelow(True)
+
+    def draw(self, df, summary):
+        ax1, ax2 = self.ax1, self.ax2
+        df, bucket = bucket_periods(df, MAX_BARS)
+        x = np.arange(len(df))
+        marker = point_marker('o', len(x))
+
+        # Create gradient bars
+        bars = self.add(ax1.bar(x, df['Revenue'], width=0.6, color=COLORS['primary_blue'],
+                                alpha=0.85, edgecolor=COLORS['light_blue'], linewidth=2, zorder=3))
+
+        # Add value labels on bars in one batched call
+        if len(x) <= LABEL_LIMIT:
+            self.add(ax1.bar_label(bars, labels=currency_labels(df['Revenue']), padding=5,
+                                   fontsize=9, fontweight='bold', color=COLORS['navy']))
+
+        self.add(ax2.plot(x, df['Customers'], color=COLORS['light_blue'], marker=marker,
+                          linewidth=3.5, markersize=8, label='Customers',
+                          markerfacecolor=COLORS['light_blue'],
+                          markeredgecolor=COLORS['white'], markeredgewidth=2, zorder=4))
+
+        # X-axis
+        set_period_ticks(ax1, x, create_quarter_labels(df))
+
+        years = int(summary['years'])
+        span = f"{years} {'year' if years == 1 else 'years'}"
+        growth = summary['revenue_growth']
+        # A zero first-year revenue makes the ratio inf (or NaN when both are zero)
+        self.subtitle.set_text(f"{int(growth)}x growth in {span}" if np.isfinite(growth)
+                               else f"Revenue over {span}")
+
+        # Legend with custom styling
+        revenue_label = ('Quarterly Revenue' if bucket == 1
+                         else f'Quarterly Revenue ({bucket}-period avg)')
+        self.legend(ax1, (revenue_label, marker), lambda: [
+            Patch(facecolor=COLORS['primary_blue'], alpha=0.85,
+                  edgecolor=COLORS['light_blue'], linewidth=2, label=revenue_label),
+            Line2D([0], [0], color=COLORS['light_blue'], linewidth=3.5,
+                   marker=marker, markersize=8, label='Total Customers'),
+        ])
+
+def build_revenue_forecast(df, summary=None):
+    """Build the revenue forecast figure with gradient bars."""
+    return RevenueForecastChart().update(df, summary)
 
 def generate_revenue_forecast(df, output_dir):
     """Generate modern revenue forecast with gradient bars."""
-    fig, ax1 = plt.subplots(figsize=(12, 6), facecolor=COLORS['white'])
-    fig.patch.set_facecolor(COLORS['white'])
-
-    x = np.arange(len(df))
-    quarters = create_quarter_labels(df)
-
-    # Create gradient bars
-    bars = ax1.bar(x, df['Revenue'], width=0.6, color=COLORS['primary_blue'],
-                   alpha=0.85, edgecolor=COLORS['light_blue'], linewidth=2, zorder=3)
-
-    # Add value labels on bars
-    for i, (bar, val) in enumerate(zip(bars, df['Revenue'])):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2, height + df['Revenue'].max()*0.02,
-                format_currency(val, None),
-                ha='center', va='bottom', fontsize=9, fontweight='bold',
-                color=COLORS['navy'])
-
-    ax1.set_xlabel('Quarter', fontweight='bold', color=COLORS['navy'], fontsize=13)
-    ax1.set_ylabel('Revenue', fontweight='bold', color=COLORS['primary_blue'], fontsize=13)
-    ax1.tick_params(axis='y', labelcolor=COLORS['primary_blue'])
-    ax1.yaxis.set_major_formatter(plt.FuncFormatter(format_currency))
-
-    # Customer line on secondary axis
-    ax2 = ax1.twinx()
-    line = ax2.plot(x, df['Customers'], color=COLORS['light_blue'], marker='o',
-                    linewidth=3.5, markersize=8, label='Customers',
-                    markerfacecolor=COLORS['light_blue'],
-                    markeredgecolor=COLORS['white'], markeredgewidth=2, zorder=4)
-    ax2.set_ylabel('Customers', fontweight='bold', color=COLORS['light_blue'], fontsize=13)
-    ax2.tick_params(axis='y', labelcolor=COLORS['light_blue'])
-    ax2.spines['right'].set_visible(False)
-
-    # X-axis
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(quarters, fontsize=10, color=COLORS['grey'])
-
-    # Title with styled box
-    title_text = 'Revenue Growth & Customer Acquisition'
-    ax1.text(0.5, 1.08, title_text, transform=ax1.transAxes,
-            fontsize=18, fontweight='bold', ha='center', color=COLORS['navy'])
-
-    # Subtitle
-    ax1.text(0.5, 1.03, '18x growth in 3 years', transform=ax1.transAxes,
-            fontsize=12, ha='center', color=COLORS['grey'], style='italic')
-
-    # Grid
-    ax1.grid(axis='y', alpha=0.15, linestyle='-', color=COLORS['grey'], linewidth=0.8, zorder=1)
-    ax1.set_axisbelow(True)
-
-    # Legend with custom styling
-    from matplotlib.patches import Patch
-    legend_elements = [
-        Patch(facecolor=COLORS['primary_blue'], alpha=0.85,
-              edgecolor=COLORS['light_blue'], linewidth=2, label='Quarterly Revenue'),
-        plt.Line2D([0], [0], color=COLORS['light_blue'], linewidth=3.5,
-                   marker='o', markersize=8, label='Total Customers')
-    ]
-    ax1.legend(handles=legend_elements, loc='upper left', frameon=True,
-              fancybox=True, shadow=True, fontsize=11)
-
-    plt.tight_layout()
-    plt.savefig(output_dir / 'revenue_forecast.pdf', dpi=300, bbox_inches='tight',
-                facecolor=COLORS['white'])
-    plt.savefig(output_dir / 'revenue_forecast.svg', dpi=300, bbox_inches='tight',
-                facecolor=COLORS['white'])
-    plt.close()
-
+    save_chart(build_revenue_forecast(df), 'revenue_forecast', output_dir)
     print(f"✓ Generated revenue_forecast chart (modern design)")
 
+class ExpenseBreakdownChart(ChartTemplate):
+    """Revenue vs. expenses bars with the profit line and breakeven call-out."""
+
+    LAYOUT = dict(left=0.085, bottom=0.139, right=0.915, top=0.879)
+
+    def scaffold(self):
+        ax = self.ax = self.fig.subplots()
+        ax2 = self.ax2 = ax.twinx()
+
+        # Zero line
+        ax2.axhline(y=0, color=COLORS['navy'], linestyle='--', linewidth=1.5, alpha=0.5, zorder=2)
+
+        ax2.set_ylabel('Net Profit', fontweight='bold', color=COLORS['light_blue'], fontsize=13)
+        ax2.tick_params(axis='y', labelcolor=COLORS['light_blue'])
+        ax2.yaxis.set_major_formatter(FuncFormatter(format_currency))
+        ax2.spines['right'].set_visible(False)
+
+        # Labels
+        ax.set_xlabel('Quarter', fontweight='bold', color=COLORS['navy'], fontsize=13)
+        ax.set_ylabel('Amount', fontweight='bold', color=COLORS['navy'], fontsize=13)
+        ax.yaxis.set_major_formatter(FuncFormatter(format_currency))
+
+        # Title
+        ax.text(0.5, 1.08, 'Financial Performance Overview', transform=ax.transAxes,
+                fontsize=18, fontweight='bold', ha='center', color=COLORS['navy'])
+        ax.text(0.5, 1.03, 'Revenue, Expenses & Path to Profitability',
+                transform=ax.transAxes, fontsize=12, ha='center',
+                color=COLORS['grey'], style='italic')
+
+        # Grid
+        ax.grid(axis='y', alpha=0.15, linestyle='-', color=COLORS['grey'], linewidth=0.8, zorder=0)
+        ax.set_axisbelow(True)
+
+    def draw(self, df, summary):
+        ax, ax2 = self.ax, self.ax2
+        df, bucket = bucket_periods(df, MAX_BARS)
+        x = np.arange(len(df))
+        marker = point_marker('D', len(x))
+        width = 0.35
+
+        # Bars with gradient effect
+        self.add(ax.bar(x - width/2, df['Revenue'], width,
+                        color=COLORS['primary_blue'], alpha=0.85,
+                        edgecolor=COLORS['light_blue'], linewidth=2, label='Revenue', zorder=3))
+        self.add(ax.bar(x + width/2, df['Expenses'], width,
+                        color=COLORS['grey'], alpha=0.6,
+                        edgecolor=COLORS['navy'], linewidth=2, label='Expenses', zorder=3))
+
+        # Fill area and line for profit
+        profit = df['Revenue'] - df['Expenses']
+        self.add(ax2.fill_between(x, 0, profit, alpha=0.15, color=COLORS['light_blue'], zorder=1))
+        self.add(ax2.plot(x, profit, color=COLORS['light_blue'], marker=marker,
+                          linewidth=4, markersize=9, label='Net Profit',
+                          markerfacecolor=COLORS['light_blue'],
+                          markeredgecolor=COLORS['white'], markeredgewidth=2, zorder=4))
+
+        # Breakeven annotation
+        # Only annotate a crossing, not a scenario that starts out profitable
+        breakeven = summary['breakeven_period']
+        if pd.notna(breakeven) and breakeven > 0:
+            breakeven_idx = int(breakeven) // bucket
+            self.add(ax2.annotate(
+                'Breakeven\nAchieved',
+                xy=(breakeven_idx, profit.iloc[breakeven_idx]),
+                xytext=(breakeven_idx-1, profit.iloc[breakeven_idx]+500000),
+                bbox=dict(boxstyle='round,pad=0.7', fc=COLORS['light_blue'],
+                          ec=COLORS['primary_blue'], alpha=0.9, linewidth=2),
+                arrowprops=dict(arrowstyle='->', color=COLORS['primary_blue'], lw=2),
+                fontsize=10, fontweight='bold', color=COLORS['white'], ha='center'))
+
+        set_period_ticks(ax, x, create_quarter_labels(df))
+
+        # Legend
+        self.legend(ax, marker, lambda: [
+            Patch(facecolor=COLORS['primary_blue'], alpha=0.85,
+                  edgecolor=COLORS['light_blue'], linewidth=2, label='Revenue'),
+            Patch(facecolor=COLORS['grey'], alpha=0.6,
+                  edgecolor=COLORS['navy'], linewidth=2, label='Expenses'),
+            Line2D([0], [0], color=COLORS['light_blue'], linewidth=4,
+                   marker=marker, markersize=9, label='Net Profit'),
+        ])
+
+def build_expense_breakdown(df, summary=None):
+    """Build the expense breakdown figure with profit emphasis."""
+    return ExpenseBreakdownChart().update(df, summary)
+
 def generate_expense_breakdown(df, output_dir):
     """Generate modern expense breakdown with profit emphasis."""
-    fig, ax = plt.subplots(figsize=(12, 6), facecolor=COLORS['white'])
-    fig.patch.set_facecolor(COLORS['white'])
-
-    x = np.arange(len(df))
-    quarters = create_quarter_labels(df)
-    width = 0.35
-
-    # Bars with gradient effect
-    bars1 = ax.bar(x - width/2, df['Revenue'], width,
-                   color=COLORS['primary_blue'], alpha=0.85,
-                   edgecolor=COLORS['light_blue'], linewidth=2, label='Revenue', zorder=3)
-    bars2 = ax.bar(x + width/2, df['Expenses'], width,
-                   color=COLORS['grey'], alpha=0.6,
-                   edgecolor=COLORS['navy'], linewidth=2, label='Expenses', zorder=3)
-
-    # Profit line
-    profit = df['Revenue'] - df['Expenses']
-    ax2 = ax.twinx()
-
-    # Fill area for profit
-    ax2.fill_between(x, 0, profit, alpha=0.15, color=COLORS['light_blue'], zorder=1)
-
-    line = ax2.plot(x, profit, color=COLORS['light_blue'], marker='D',
-                    linewidth=4, markersize=9, label='Net Profit',
-                    markerfacecolor=COLORS['light_blue'],
-                    markeredgecolor=COLORS['white'], markeredgewidth=2, zorder=4)
-
-    # Zero line
-    ax2.axhline(y=0, color=COLORS['navy'], linestyle='--', linewidth=1.5, alpha=0.5, zorder=2)
-
-    # Breakeven annotation
-    breakeven_idx = next((i for i, p in enumerate(profit) if p > 0), None)
-    if breakeven_idx:
-        ax2.annotate('Breakeven\nAchieved',
-                    xy=(breakeven_idx, profit.iloc[breakeven_idx]),
-                    xytext=(breakeven_idx-1, profit.iloc[breakeven_idx]+500000),
-                    bbox=dict(boxstyle='round,pad=0.7', fc=COLORS['light_blue'],
-                             ec=COLORS['primary_blue'], alpha=0.9, linewidth=2),
-                    arrowprops=dict(arrowstyle='->', color=COLORS['primary_blue'], lw=2),
-                    fontsize=10, fontweight='bold', color=COLORS['white'], ha='center')
-
-    ax2.set_ylabel('Net Profit', fontweight='bold', color=COLORS['light_blue'], fontsize=13)
-    ax2.tick_params(axis='y', labelcolor=COLORS['light_blue'])
-    ax2.yaxis.set_major_formatter(plt.FuncFormatter(format_currency))
-    ax2.spines['right'].set_visible(False)
-
-    # Labels
-    ax.set_xlabel('Quarter', fontweight='bold', color=COLORS['navy'], fontsize=13)
-    ax.set_ylabel('Amount', fontweight='bold', color=COLORS['navy'], fontsize=13)
-    ax.set_xticks(x)
-    ax.set_xticklabels(quarters, fontsize=10, color=COLORS['grey'])
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_currency))
-
-    # Title
-    ax.text(0.5, 1.08, 'Financial Performance Overview', transform=ax.transAxes,
-            fontsize=18, fontweight='bold', ha='center', color=COLORS['navy'])
-    ax.text(0.5, 1.03, 'Revenue, Expenses & Path to Profitability',
-            transform=ax.transAxes, fontsize=12, ha='center',
-            color=COLORS['grey'], style='italic')
-
-    # Grid
-    ax.grid(axis='y', alpha=0.15, linestyle='-', color=COLORS['grey'], linewidth=0.8, zorder=0)
-    ax.set_axisbelow(True)
-
-    # Legend
-    from matplotlib.patches import Patch
-    legend_elements = [
-        Patch(facecolor=COLORS['primary_blue'], alpha=0.85,
-              edgecolor=COLORS['light_blue'], linewidth=2, label='Revenue'),
-        Patch(facecolor=COLORS['grey'], alpha=0.6,
-              edgecolor=COLORS['navy'], linewidth=2, label='Expenses'),
-        plt.Line2D([0], [0], color=COLORS['light_blue'], linewidth=4,
-                   marker='D', markersize=9, label='Net Profit')
-    ]
-    ax.legend(handles=legend_elements, loc='upper left', frameon=True,
-             fancybox=True, shadow=True, fontsize=11)
-
-    plt.tight_layout()
-    plt.savefig(output_dir / 'expense_breakdown.pdf', dpi=300, bbox_inches='tight',
-                facecolor=COLORS['white'])
-    plt.savefig(output_dir / 'expense_breakdown.svg', dpi=300, bbox_inches='tight',
-                facecolor=COLORS['white'])
-    plt.close()
-
+    save_chart(build_expense_breakdown(df), 'expense_breakdown', output_dir)
     print(f"✓ Generated expense_breakdown chart (modern design)")
 
-def generate_arr_growth(df, output_dir):
-    """Generate modern ARR growth with milestone emphasis."""
-    fig, ax = plt.subplots(figsize=(12, 6), facecolor=COLORS['white'])
-    fig.patch.set_facecolor(COLORS['white'])
-
-    x = np.arange(len(df))
-    quarters = create_quarter_labels(df)
-
-    # Gradient fill
-    ax.fill_between(x, 0, df['ARR'], alpha=0.25,
-                     color=COLORS['primary_blue'], zorder=1)
-    ax.plot(x, df['ARR'], color=COLORS['primary_blue'], marker='o',
-            linewidth=4, markersize=10, markerfacecolor=COLORS['light_blue'],
-            markeredgecolor=COLORS['white'], markeredgewidth=3, label='ARR', zorder=3)
-
-    # Milestone markers
-    milestones = [
-        (3, 'Break $1M ARR', df.iloc[3]['ARR']),
-        (7, 'Break $10M ARR', df.iloc[7]['ARR']),
-        (11, 'Break $50M ARR', df.iloc[11]['ARR'])
-    ]
-
-    for idx, label, value in milestones:
-        if idx < len(df):
+class ArrGrowthChart(ChartTemplate):
+    """ARR trajectory with milestone markers."""
+
+    # Room on the right for a milestone call-out near the last quarter
+    LAYOUT = dict(left=0.085, bottom=0.139, right=0.893, top=0.879)
+
+    def scaffold(self):
+        ax = self.ax = self.fig.subplots()
+
+        # Labels
+        ax.set_xlabel('Quarter', fontweight='bold', color=COLORS['navy'], fontsize=13)
+        ax.set_ylabel('Annual Recurring Revenue (ARR)', fontweight='bold',
+                      color=COLORS['navy'], fontsize=13)
+        ax.yaxis.set_major_formatter(FuncFormatter(format_currency))
+
+        # Title
+        ax.text(0.5, 1.08, 'ARR Growth Trajectory', transform=ax.transAxes,
+                fontsize=18, fontweight='bold', ha='center', color=COLORS['navy'])
+        self.subtitle = ax.text(0.5, 1.03, '', transform=ax.transAxes, fontsize=12,
+                                ha='center', color=COLORS['grey'], style='italic')
+
+        # Grid
+        ax.grid(axis='y', alpha=0.15, linestyle='-', color=COLORS['grey'],
+                linewidth=0.8, zorder=0)
+        ax.set_axisbelow(True)
+
+    def draw(self, df, summary):
+        ax = self.ax
+        x = np.arange(len(df))
+
+        # Long series keep only the points the figure has pixels for
+        keep = lttb(x, df['ARR'], line_resolution(self.fig))
+        line_x, line_arr = x[keep], df['ARR'].to_numpy()[keep]
+
+        # Gradient fill
+        self.add(ax.fill_between(line_x, 0, line_arr, alpha=0.25,
+                                 color=COLORS['primary_blue'], zorder=1))
+        self.add(ax.plot(line_x, line_arr, color=COLORS['primary_blue'],
+                         marker=point_marker('o', len(keep)), linewidth=4, markersize=10,
+                         markerfacecolor=COLORS['light_blue'], markeredgecolor=COLORS['white'],
+                         markeredgewidth=3, label='ARR', zorder=3))
+
+        # Milestone markers where ARR first reaches each level
+        milestones = [
+            (int(summary[milestone_column(t)]), f'Break {milestone_label(t)} ARR')
+            for t in ARR_MILESTONES if pd.notna(summary[milestone_column(t)])
+        ]
+
+        for idx, label in milestones:
+            value = df['ARR'].iloc[idx]
             # Draw milestone marker
-            ax.plot(idx, value, 'D', markersize=15,
-                   color=COLORS['light_blue'], markeredgecolor=COLORS['white'],
-                   markeredgewidth=3, zorder=4)
+            self.add(ax.plot(idx, value, 'D', markersize=15,
+                             color=COLORS['light_blue'], markeredgecolor=COLORS['white'],
+                             markeredgewidth=3, zorder=4))
 
             # Annotation with styled box
-            ax.annotate(label, xy=(idx, value),
-                       xytext=(15, 25), textcoords='offset points',
-                       bbox=dict(boxstyle='round,pad=0.8', fc=COLORS['primary_blue'],
-                                ec=COLORS['light_blue'], alpha=0.95, linewidth=2.5),
-                       arrowprops=dict(arrowstyle='->', color=COLORS['light_blue'],
-                                      lw=2.5, connectionstyle='arc3,rad=0.3'),
-                       fontsize=10, fontweight='bold', color=COLORS['white'])
-
-    # Labels
-    ax.set_xlabel('Quarter', fontweight='bold', color=COLORS['navy'], fontsize=13)
-    ax.set_ylabel('Annual Recurring Revenue (ARR)', fontweight='bold',
-                  color=COLORS['navy'], fontsize=13)
-    ax.set_xticks(x)
-    ax.set_xticklabels(quarters, fontsize=10, color=COLORS['grey'])
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(format_currency))
-
-    # Title
-    ax.text(0.5, 1.08, 'ARR Growth Trajectory', transform=ax.transAxes,
-            fontsize=18, fontweight='bold', ha='center', color=COLORS['navy'])
-    ax.text(0.5, 1.03, 'On track to $50M+ ARR by Q4 2027',
-            transform=ax.transAxes, fontsize=12, ha='center',
-            color=COLORS['grey'], style='italic')
-
-    # Grid
-    ax.grid(axis='y', alpha=0.15, linestyle='-', color=COLORS['grey'],
-            linewidth=0.8, zorder=0)
-    ax.set_axisbelow(True)
-
-    plt.tight_layout()
-    plt.savefig(output_dir / 'arr_growth.pdf', dpi=300, bbox_inches='tight',
-                facecolor=COLORS['white'])
-    plt.savefig(output_dir / 'arr_growth.svg', dpi=300, bbox_inches='tight',
-                facecolor=COLORS['white'])
-    plt.close()
+            self.add(ax.annotate(label, xy=(idx, value),
+                                 xytext=(15, 25), textcoords='offset points',
+                                 bbox=dict(boxstyle='round,pad=0.8', fc=COLORS['primary_blue'],
+                                           ec=COLORS['light_blue'], alpha=0.95, linewidth=2.5),
+                                 arrowprops=dict(arrowstyle='->', color=COLORS['light_blue'],
+                                                 lw=2.5, connectionstyle='arc3,rad=0.3'),
+                                 fontsize=10, fontweight='bold', color=COLORS['white']))
+
+        set_period_ticks(ax, x, create_quarter_labels(df))
 
+        reached = [t for t in ARR_MILESTONES if pd.notna(summary[milestone_column(t)])]
+        target = (f'{milestone_label(reached[-1])}+' if reached
+                  else format_currency(summary['final_arr']))
+        self.subtitle.set_text(f"On track to {target} ARR by {summary['final_label']}")
+
+def build_arr_growth(df, summary=None):
+    """Build the ARR growth figure with milestone emphasis."""
+    return ArrGrowthChart().update(df, summary)
+
+def generate_arr_growth(df, output_dir):
+    """Generate modern ARR growth with milestone emphasis."""
+    save_chart(build_arr_growth(df), 'arr_growth', output_dir)
     print(f"✓ Generated arr_growth chart (modern design)")
 
-def main():
-    """Main function to generate all modern charts."""
-    script_dir = Path(__file__).parent
-    project_dir = script_dir.parent
-    data_file = project_dir / 'data' / 'forecast.csv'
-    output_dir = project_dir / 'charts'
+# Chart name -> (template class, CSV columns it reads)
+CHARTS = {
+    'revenue_forecast': (RevenueForecastChart, ['Quarter', 'Year', 'Revenue', 'Customers']),
+    'expense_breakdown': (ExpenseBreakdownChart, ['Quarter', 'Year', 'Revenue', 'Expenses']),
+    'arr_growth': (ArrGrowthChart, ['Quarter', 'Year', 'ARR']),
+}
 
+# Helpers whose code is part of every chart's fingerprint
+SHARED_HELPERS = (format_currency, create_quarter_labels, save_chart, rasterize_heavy_artists,
+                  warm_fonts, ChartTemplate)
+
+# One template per chart in this process, refilled for every scenario it renders
+_templates = {}
+
+def chart_template(name):
+    """The reusable template for chart ``name``, built on first use."""
+    if name not in _templates:
+        template_class, _ = CHARTS[name]
+        _templates[name] = template_class()
+    return _templates[name]
+
+def render_chart(name, df, output_dir, formats=OUTPUT_FORMATS, summary=None, rasterize=False,
+                 fixed_layout=False):
+    """Build and save one chart, returning its build and per-format save times.
+
+    With ``fixed_layout`` the template's precomputed margins and
+    ``FIXED_BBOX`` replace ``tight_layout`` and the tight bounding box, and
+    the fonts are resolved up front by ``warm_fonts``.
+    """
+    if fixed_layout:
+        warm_fonts()
+    start = time.perf_counter()
+    fig = chart_template(name).update(df, summary, fixed_layout)
+    if rasterize:
+        rasterize_heavy_artists(fig)
+    timings = {'build': time.perf_counter() - start}
+    instrument.record('chart_build', timings['build'], chart=name, output_dir=output_dir,
+                      rows=len(df))
+    for fmt in formats:
+        start = time.perf_counter()
+        save_chart(fig, name, output_dir, formats=(fmt,), fixed_layout=fixed_layout)
+        timings[fmt] = time.perf_counter() - start
+        instrument.record('savefig', timings[fmt], chart=name, output_dir=output_dir,
+                          format=fmt)
+    return timings
+
+def _render_task(task):
+    """Worker: render one (chart, format) pair and report when it ran."""
+    output_dir, name, fmt, df, summary, rasterize, fixed_layout = task
+    start = time.perf_counter()
+    timings = render_chart(name, df, output_dir, formats=(fmt,), summary=summary,
+                           rasterize=rasterize, fixed_layout=fixed_layout)
+    return output_dir, name, fmt, timings, start, time.perf_counter()
+
+def render_charts_parallel(charts, jobs, formats=OUTPUT_FORMATS, rasterize=False,
+                           fixed_layout=False):
+    """Render charts and their output formats concurrently in a process pool.
+
+    ``charts`` holds ``(output_dir, name, df, summary)`` entries. Each
+    (chart, format) pair is an independent task drawn with the object-oriented
+    API into the worker's own chart templates, so no pyplot state is shared. Returns
+    ``{(output_dir, name): (wall_seconds, timings)}`` where ``timings`` holds
+    the build and save time of each format.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = [(output_dir, name, fmt, df, summary, rasterize, fixed_layout)
+             for output_dir, name, df, summary in charts for fmt in formats]
+    spans, timings = {}, {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for output_dir, name, fmt, task_timings, start, end in executor.map(_render_task, tasks):
+            key = (output_dir, name)
+            first, last = spans.get(key, (start, end))
+            spans[key] = (min(first, start), max(last, end))
+            timings.setdefault(key, {})[f'build:{fmt}'] = task_timings['build']
+            timings[key][fmt] = task_timings[fmt]
+    return {key: (spans[key][1] - spans[key][0], timings[key]) for key in spans}
+
+def format_timings(timings):
+    return ', '.join(f"{step} {seconds:.2f}s" for step, seconds in timings.items())
+
+def chart_fingerprint(name, df, formats=OUTPUT_FORMATS, rasterize=False, fixed_layout=False):
+    """Hash everything a chart's output depends on.
+
+    Covers the CSV columns the chart reads, the colors and style sheet,
+    the output options and density limits, and the source of its template
+    class, the shared helpers and forecast.py (whose series derivation,
+    bucketing and labels the templates draw), so unrelated column or code
+    edits do not invalidate it.
+    """
+    template_class, columns = CHARTS[name]
+    digest = hashlib.sha256()
+    digest.update(df[columns].to_csv(index=False).encode())
+    digest.update(STYLE_SHEET.read_bytes())
+    digest.update(json.dumps([COLORS, sorted(formats), rasterize, fixed_layout,
+                              MAX_BARS, MARKER_LIMIT, LABEL_LIMIT, MAX_TICK_LABELS, FIXED_BBOX],
+                             sort_keys=True).encode())
+    for func in (template_class,) + SHARED_HELPERS + (forecast,):
+        digest.update(inspect.getsource(func).encode())
+    return digest.hexdigest()
+
+def load_manifest(output_dir):
+    """Read the build manifest, or an empty one if missing or unreadable."""
+    try:
+        return json.loads((output_dir / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(output_dir, manifest):
+    (output_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+def is_up_to_date(name, fingerprint, manifest, output_dir, formats=OUTPUT_FORMATS):
+    """True when the manifest fingerprint matches and every output exists."""
+    return (manifest.get(name) == fingerprint and
+            all((output_dir / f'{name}.{fmt}').exists() for fmt in formats))
+
+def build_charts(args, output_dir, names=None):
+    """Load the forecast and render every stale chart into ``output_dir``.
+
+    ``names`` limits the check to those charts (default: all). Returns the
+    number of charts rendered.
+    """
+    formats = tuple(args.formats)
+    data_file = args.data
     output_dir.mkdir(exist_ok=True)
 
+    # Only the columns these charts and the scenario summary read
+    columns = {SCENARIO_COLUMN, *SUMMARY_COLUMNS}
+    for name in names or CHARTS:
+        columns.update(CHARTS[name][1])
+
     print(f"Loading data from {data_file}...")
-    df = pd.read_csv(data_file)
+    with instrument.stage('csv_load', file=data_file):
+        df = load_forecast(data_file, columns)
+
+    # Derived series for every scenario are computed together, up front
+    per_scenario = SCENARIO_COLUMN in df
+    with instrument.stage('derive', rows=len(df)):
+        derived = derive_series(df)
+        summary = scenario_summary(derived)
 
     print("Generating modern, visually striking charts...")
-    generate_revenue_forecast(df, output_dir)
-    generate_expense_breakdown(df, output_dir)
-    generate_arr_growth(df, output_dir)
+    manifests, stale = {}, []
+    with instrument.stage('manifest_check'):
+        for scenario, frame, row in iter_scenarios(derived, summary):
+            chart_dir = (output_dir / 'scenarios' / scenario_slug(scenario)
+                         if per_scenario else output_dir)
+            chart_dir.mkdir(parents=True, exist_ok=True)
+            manifest = manifests[chart_dir] = load_manifest(chart_dir)
+            for name in names or CHARTS:
+                fingerprint = chart_fingerprint(name, frame, formats, args.rasterize,
+                                                args.fixed_layout)
+                label = f"{scenario_slug(scenario)}/{name}" if per_scenario else name
+                if not args.force and is_up_to_date(name, fingerprint, manifest, chart_dir,
+                                                    formats):
+                    print(f"✓ {label} is up to date (skipped)")
+                else:
+                    stale.append((chart_dir, name, frame, row, fingerprint, label))
+
+    if args.jobs > 1 and stale:
+        results = render_charts_parallel(
+            [(chart_dir, name, frame, row) for chart_dir, name, frame, row, _, _ in stale],
+            args.jobs, formats, args.rasterize, args.fixed_layout)
+        for chart_dir, name, _, _, fingerprint, label in stale:
+            wall, timings = results[chart_dir, name]
+            print(f"✓ Generated {label} chart in {wall:.2f}s ({format_timings(timings)})")
+            manifests[chart_dir][name] = fingerprint
+        for chart_dir, manifest in manifests.items():
+            save_manifest(chart_dir, manifest)
+    else:
+        for chart_dir, name, frame, row, fingerprint, label in stale:
+            start = time.perf_counter()
+            timings = render_chart(name, frame, chart_dir, formats, summary=row,
+                                   rasterize=args.rasterize, fixed_layout=args.fixed_layout)
+            wall = time.perf_counter() - start
+            print(f"✓ Generated {label} chart in {wall:.2f}s ({format_timings(timings)})")
+            manifests[chart_dir][name] = fingerprint
+            # Record progress as we go so an interrupted build keeps finished charts
+            save_manifest(chart_dir, manifests[chart_dir])
 
     print(f"\n✓ All modern charts generated in {output_dir}/")
     print(f"  Style: Modern, gradient-based, visually engaging")
+    return len(stale)
+
+def main():
+    """Main function to generate all modern charts."""
+    script_dir = Path(__file__).parent
+    project_dir = script_dir.parent
+
+    parser = argparse.ArgumentParser(description='Generate financial charts from forecast data')
+    parser.add_argument('--data', type=Path, default=project_dir / 'data' / 'forecast.csv',
+                        help='Forecast table (CSV, Parquet, Feather or NPZ); a long-format '
+                             'table with a Scenario column produces one chart set per scenario')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate every chart even if it is up to date')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Render charts and formats in this many processes (default: 1)')
+    parser.add_argument('--formats', nargs='+', default=list(OUTPUT_FORMATS),
+                        choices=['pdf', 'svg', 'png'],
+                        help='Formats to write (default: pdf svg); LaTeX only needs pdf')
+    parser.add_argument('--rasterize', action='store_true',
+                        help='Draw fill areas and gradients as bitmaps to keep vector output small')
+    parser.add_argument('--fixed-layout', action='store_true',
+                        help='Use precomputed chart margins instead of tight_layout and tight '
+                             'bounding boxes, with the fonts resolved up front')
+    parser.add_argument('--convert-svgs', type=Path, metavar='DIR',
+                        help='Only convert the SVGs in DIR to PDF in-process (needs cairosvg)')
+    parser.add_argument('--timings', metavar='FILE',
+                        help='Append per-stage timings and peak memory as JSON lines '
+                             '(default: $BUILD_TIMINGS)')
+    parser.add_argument('--profile', metavar='FILE',
+                        help='Profile the run: .html uses pyinstrument, otherwise cProfile stats')
+    args = parser.parse_args()
+    if args.timings:
+        instrument.configure(args.timings)
+
+    if args.convert_svgs:
+        try:
+            written = convert_svgs(sorted(args.convert_svgs.glob('*.svg')))
+        except (ImportError, OSError) as e:
+            # OSError: the module is installed but the Cairo library is not
+            print(f"✗ In-process SVG conversion unavailable: {e}")
+            raise SystemExit(2)
+        for pdf in written:
+            print(f"  Converted {pdf.with_suffix('.svg').name} -> {pdf.name}")
+        print(f"✓ Converted {len(written)} SVG(s) to PDF")
+        return
+
+    with instrument.profiled(args.profile), instrument.stage('generate_charts'):
+        build_charts(args, project_dir / 'charts')
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Build instrumentation.
+Records per-stage timings and peak memory as JSON lines, and wraps code in an
+optional cProfile/pyinstrument profiler.
+
+Recording is enabled by pointing the BUILD_TIMINGS environment variable at an
+output file (the CLIs also take --timings). Child processes inherit it, so
+chart workers, rebrand workers and build.sh stages all append to one file.
+When it is unset, ``stage()`` costs a single environment lookup.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from contextlib import contextmanager
+from pathlib import Path
+
+TIMINGS_ENV = 'BUILD_TIMINGS'
+
+def configure(path):
+    """Append stage records to ``path``, here and in child processes."""
+    os.environ[TIMINGS_ENV] = str(Path(path).resolve())
+
+def enabled():
+    return bool(os.environ.get(TIMINGS_ENV))
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB.
+
+    Prefers ``VmHWM``: on Linux ``ru_maxrss`` survives ``exec``, so a child
+    would otherwise report its parent's peak if that was higher.
+    """
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and KB elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def record(name, seconds, **fields):
+    """Append one stage record; ``fields`` add context such as chart or page."""
+    path = os.environ.get(TIMINGS_ENV)
+    if not path:
+        return
+    entry = {
+        'stage': name,
+        'seconds': round(seconds, 6),
+        'peak_rss_mb': round(peak_rss_kb() / 1024, 1),
+        'pid': os.getpid(),
+        'time': round(time.time(), 3),
+    }
+    entry.update(fields)
+    # One short append per record keeps lines from concurrent workers intact
+    with open(path, 'a') as f:
+        f.write(json.dumps(entry, default=str) + '\n')
+
+@contextmanager
+def stage(name, **fields):
+    """Time the enclosed block as stage ``name`` when recording is enabled.
+
+    ``peak_rss_mb`` is the process high-water mark when the stage ends.
+    """
+    if not enabled():
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start, **fields)
+
+@contextmanager
+def profiled(path):
+    """Profile the enclosed block into ``path``; a no-op when ``path`` is empty.
+
+    A ``.html`` path uses pyinstrument if it is installed; anything else (or
+    a missing pyinstrument) writes cProfile stats, readable with ``pstats``
+    or snakeviz.
+    """
+    if not path:
+        yield
+        return
+    path = Path(path)
+    if path.suffix == '.html':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            print("Warning: pyinstrument not installed, writing cProfile stats instead")
+            path = path.with_suffix('.prof')
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield
+            finally:
+                profiler.stop()
+                path.write_text(profiler.output_html())
+                print(f"✓ Profile written to {path}")
+            return
+
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+        print(f"✓ Profile written to {path} (python -m pstats {path})")
+
+def run_command(name, command, **kwargs):
+    """Run an external command as stage ``name``, recording the child's peak RSS.
+
+    ``kwargs`` go to ``subprocess.Popen`` (e.g. ``cwd`` or ``stdout``). The
+    child is reaped with ``os.wait4`` so the peak is its own, not the running
+    maximum over every child this process has waited for.
+    """
+    start = time.perf_counter()
+    with subprocess.Popen(command, **kwargs) as proc:
+        try:
+            _, status, usage = os.wait4(proc.pid, 0)
+        except BaseException:
+            proc.kill()
+            raise
+        proc.returncode = returncode = os.waitstatus_to_exitcode(status)
+    seconds = time.perf_counter() - start
+    peak = usage.ru_maxrss
+    peak_kb = peak // 1024 if sys.platform == 'darwin' else peak
+    record(name, seconds, peak_rss_mb=round(peak_kb / 1024, 1),
+           command=' '.join(command), returncode=returncode)
+    return returncode
+
+def summarize(path):
+    """Print total, mean and max time and peak memory for each stage in a timings file."""
+    stages = {}
+    with open(path) as f:
+        for line in f:
+            entry = json.loads(line)
+            stats = stages.setdefault(entry['stage'], [0, 0.0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += entry['seconds']
+            stats[2] = max(stats[2], entry['seconds'])
+            stats[3] = max(stats[3], entry.get('peak_rss_mb', 0.0))
+
+    print(f"{'stage':<24} {'count':>7} {'total s':>10} {'mean ms':>10} {'max ms':>10} {'peak MB':>9}")
+    for name, (count, total, longest, peak) in sorted(stages.items(), key=lambda s: -s[1][1]):
+        print(f"{name:<24} {count:>7} {total:>10.3f} {total / count * 1000:>10.2f} "
+              f"{longest * 1000:>10.2f} {peak:>9.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Build pipeline timing helpers')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run a command and record it as a stage')
+    run_parser.add_argument('stage', help='Stage name, e.g. pdflatex:pass1')
+    run_parser.add_argument('argv', nargs=argparse.REMAINDER,
+                            help='Command to run, after --')
+
+    summary_parser = subparsers.add_parser('summary', help='Aggregate a timings file by stage')
+    summary_parser.add_argument('timings', nargs='?', default=os.environ.get(TIMINGS_ENV),
+                                help='JSON-lines timings file (default: $BUILD_TIMINGS)')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        command = args.argv[1:] if args.argv[:1] == ['--'] else args.argv
+        if not command:
+            parser.error('run needs a command after --')
+        sys.exit(run_command(args.stage, command))
+    if not args.timings:
+        parser.error('no timings file given and BUILD_TIMINGS is not set')
+    summarize(args.timings)
+
+if __name__ == '__main__':
+    main()
@@ -8,34 +8,84 @@ Extracts content and applies new corporate template.
 import sys
 import argparse
 from pathlib import Path
-from io import BytesIO
+from io import BytesIO, StringIO
 import subprocess
 import tempfile
+import csv
+import glob
+import re
+import shutil
+import time
+from contextlib import redirect_stdout
+from functools import lru_cache
+
+import instrument
+
+def _missing_packages():
+    print("Error: Required packages not found.")
+    print("Install with: pip install PyPDF2 reportlab")
+    sys.exit(1)
 
 try:
-    from PyPDF2 import PdfReader, PdfWriter, Transformation
-    from reportlab.pdfgen import canvas
     from reportlab.lib.pagesizes import letter
     from reportlab.lib.units import inch
-    from reportlab.lib.colors import HexColor
 except ImportError:
-    print("Error: Required packages not found.")
-    print("Install with: pip install PyPDF2 reportlab")
-    sys.exit(1)
+    _missing_packages()
 
-# Anthropic-inspired colors
-ORANGE = HexColor('#E86C38')
-DARK_ORANGE = HexColor('#BF4C21')
-BLACK = HexColor('#191919')
-GRAY = HexColor('#5F5F5F')
-LIGHT_GRAY = HexColor('#F5F5F5')
+def _load_pdf_libs():
+    """Import PyPDF2 and the ReportLab canvas on first use.
 
-def create_overlay(page_num, total_pages, branding_config):
-    """Create a branded overlay for a PDF page."""
-    packet = BytesIO()
-    can = canvas.Canvas(packet, pagesize=letter)
-    width, height = letter
+    They dominate startup, so ``--help``, ``--create-sample`` and argument
+    errors skip them. The names are bound at module level, so the rest of
+    the file uses them as ordinary globals once this has run.
+    """
+    global PdfReader, PdfWriter, PageObject, Transformation, canvas, stringWidth
+    global ArrayObject, DecodedStreamObject, DictionaryObject, EncodedStreamObject
+    global FloatObject, IndirectObject, NameObject, NumberObject, StreamObject
+    global create_string_object, read_object
+    if 'PdfReader' in globals():
+        return
+    try:
+        from PyPDF2 import PdfReader, PdfWriter, PageObject, Transformation
+        from PyPDF2.generic import (ArrayObject, DecodedStreamObject, DictionaryObject,
+                                    EncodedStreamObject, FloatObject, IndirectObject,
+                                    NameObject, NumberObject, StreamObject,
+                                    create_string_object, read_object)
+        from reportlab.pdfgen import canvas
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+    except ImportError:
+        _missing_packages()
+
+# Anthropic-inspired colors (hex strings, which ReportLab accepts directly)
+ORANGE = '#E86C38'
+DARK_ORANGE = '#BF4C21'
+BLACK = '#191919'
+GRAY = '#5F5F5F'
+LIGHT_GRAY = '#F5F5F5'
+
+def _rgb(color):
+    """``(r, g, b)`` fractions of a ``#RRGGBB`` color, as ``HexColor.rgb()``."""
+    return tuple(int(color[i:i + 2], 16) / 255 for i in (1, 3, 5))
 
+# Branding keys that affect the static (page-independent) overlay content
+OVERLAY_KEYS = ('company', 'document_type', 'header', 'footer',
+                'watermark', 'watermark_text', 'accent_bar')
+
+PAGE_NUMBER_FONT = 'Helvetica'
+PAGE_NUMBER_SIZE = 9
+
+# Overlay placement on an upright page whose visible box starts at the origin
+IDENTITY = (1, 0, 0, 1, 0, 0)
+
+# Pages between reader cache flushes in streaming mode
+STREAM_CHUNK_PAGES = 50
+
+def _draw_overlay(can, width, height, branding_config, page_label=None):
+    """Draw the branding overlay onto a ReportLab canvas.
+
+    The footer page number is only drawn when ``page_label`` is given, so the
+    same routine renders both full per-page overlays and the static template.
+    """
     # Header
     if branding_config.get('header', True):
         can.setFillColor(ORANGE)
@@ -58,7 +108,9 @@ def create_overlay(page_num, total_pages, branding_config):
         can.setFillColor(GRAY)
         can.setFont("Helvetica", 9)
         can.drawString(0.5*inch, 0.15*inch, f"© 2025 {branding_config.get('company', 'Your Company')}")
-        can.drawCentredString(width/2, 0.15*inch, f"Page {page_num} of {total_pages}")
+        if page_label is not None:
+            can.setFont(PAGE_NUMBER_FONT, PAGE_NUMBER_SIZE)
+            can.drawCentredString(width/2, 0.15*inch, page_label)
         can.drawRightString(width - 0.5*inch, 0.15*inch, "Confidential")
 
     # Watermark (if enabled)
@@ -77,47 +129,740 @@ def create_overlay(page_num, total_pages, branding_config):
         can.setFillColor(ORANGE)
         can.rect(0, 0.5*inch, 0.15*inch, height - inch, fill=True, stroke=False)
 
+def create_overlay(page_num, total_pages, branding_config, pagesize=letter):
+    """Create a branded overlay for a PDF page of ``pagesize``."""
+    _load_pdf_libs()
+    packet = BytesIO()
+    can = canvas.Canvas(packet, pagesize=pagesize)
+    width, height = pagesize
+
+    _draw_overlay(can, width, height, branding_config,
+                  page_label=f"Page {page_num} of {total_pages}")
+
     can.save()
     packet.seek(0)
     return packet
 
-def rebrand_pdf(input_path, output_path, branding_config):
-    """Rebrand an existing PDF with new styling."""
-    print(f"Rebranding PDF: {input_path}")
+def _page_geometry(page):
+    """Upright size of a page as displayed, and the matrix that places an overlay.
 
-    # Read input PDF
-    reader = PdfReader(input_path)
-    writer = PdfWriter()
-    total_pages = len(reader.pages)
+    The overlay is drawn for the page as a reader sees it: the crop box (which
+    defaults to the media box) turned by ``/Rotate``. The returned ``cm``
+    matrix maps that upright overlay back into the page's own user space,
+    including a crop box that does not start at the origin.
+    """
+    box = page.cropbox
+    left, bottom = float(box.left), float(box.bottom)
+    width, height = float(box.width), float(box.height)
+    rotation = page.rotation % 360
+    if rotation == 90:
+        return (height, width), (0, 1, -1, 0, left + width, bottom)
+    if rotation == 180:
+        return (width, height), (-1, 0, 0, -1, left + width, bottom + height)
+    if rotation == 270:
+        return (height, width), (0, -1, 1, 0, left, bottom + height)
+    return (width, height), (1, 0, 0, 1, left, bottom)
 
-    print(f"Processing {total_pages} pages...")
+def _overlay_key(branding_config, pagesize):
+    """Hashable cache key for the static overlay of a config and page size."""
+    items = tuple((key, branding_config[key]) for key in OVERLAY_KEYS if key in branding_config)
+    return items, (float(pagesize[0]), float(pagesize[1]))
 
-    for page_num, page in enumerate(reader.pages, start=1):
-        # Create overlay for this page
-        overlay_packet = create_overlay(page_num, total_pages, branding_config)
-        overlay_reader = PdfReader(overlay_packet)
-        overlay_page = overlay_reader.pages[0]
+@lru_cache(maxsize=64)
+def _overlay_template(key):
+    """Render the static overlay for ``key`` once and parse it back.
 
-        # Merge original page with overlay
-        page.merge_page(overlay_page)
-        writer.add_page(page)
+    Returns the template page; its content and resources become the shared
+    branding form XObject.
+    """
+    _load_pdf_libs()
+    items, (width, height) = key
+    packet = BytesIO()
+    can = canvas.Canvas(packet, pagesize=(width, height))
+    _draw_overlay(can, width, height, dict(items))
+    can.showPage()
+    can.save()
+    packet.seek(0)
+    return PdfReader(packet).pages[0]
 
-        if page_num % 10 == 0:
-            print(f"  Processed {page_num}/{total_pages} pages")
+class OverlayCache:
+    """Per-writer cache of branding form XObjects.
 
-    # Add metadata
-    writer.add_metadata({
+    The static parts of the overlay (header, footer band, watermark and accent
+    bar) are rendered by ReportLab once per branding config and page size and
+    stored in the output as a single form XObject. Each page then only gets a
+    tiny content stream that paints the form and its "Page N of M" label.
+    """
+
+    def __init__(self, writer):
+        _load_pdf_libs()
+        self.writer = writer
+        self._forms = {}
+        self._font = None
+
+    def _add_object(self, obj):
+        """Add ``obj`` and everything it references to the output document."""
+        if isinstance(self.writer, StreamingPdfWriter):
+            return self.writer.add_object(obj)
+        return self.writer._add_object(obj.clone(self.writer))
+
+    def form(self, branding_config, pagesize):
+        """Return an indirect reference to the form for this config and size."""
+        key = _overlay_key(branding_config, pagesize)
+        if key not in self._forms:
+            with instrument.stage('template_render', size=key[1]):
+                template = _overlay_template(key)
+            form = DecodedStreamObject()
+            form.set_data(template.get_contents().get_data())
+            form.update({
+                NameObject('/Type'): NameObject('/XObject'),
+                NameObject('/Subtype'): NameObject('/Form'),
+                NameObject('/BBox'): ArrayObject(
+                    [FloatObject(0), FloatObject(0),
+                     FloatObject(key[1][0]), FloatObject(key[1][1])]),
+                NameObject('/Resources'): DictionaryObject({
+                    NameObject(name): value.get_object()
+                    for name, value in template['/Resources'].items()
+                }),
+            })
+            self._forms[key] = self._add_object(form)
+        return self._forms[key]
+
+    def page_number_font(self):
+        """Return an indirect reference to the shared page number font."""
+        if self._font is None:
+            self._font = self._add_object(DictionaryObject({
+                NameObject('/Type'): NameObject('/Font'),
+                NameObject('/Subtype'): NameObject('/Type1'),
+                NameObject('/BaseFont'): NameObject('/' + PAGE_NUMBER_FONT),
+                NameObject('/Encoding'): NameObject('/WinAnsiEncoding'),
+            }))
+        return self._font
+
+    def overlay_content(self, page_num, total_pages, branding_config, pagesize=letter,
+                        ctm=IDENTITY, suffix=''):
+        """Content stream and resources that paint the overlay for one page.
+
+        The form for ``pagesize`` is shared by every page of that size; ``ctm``
+        places it on a rotated or offset page. ``suffix`` is appended to the
+        resource names, to keep them clear of names a page already uses.
+        """
+        width, height = pagesize
+        form_name, font_name = f'/BrandOverlay{suffix}', f'/BrandPageFont{suffix}'
+        ops = [f'q {form_name} Do Q'.encode('ascii')]
+        resources = DictionaryObject({
+            NameObject('/XObject'): DictionaryObject({
+                NameObject(form_name): self.form(branding_config, pagesize),
+            }),
+        })
+
+        if branding_config.get('footer', True):
+            label = f"Page {page_num} of {total_pages}"
+            x = width/2 - stringWidth(label, PAGE_NUMBER_FONT, PAGE_NUMBER_SIZE)/2
+            r, g, b = _rgb(GRAY)
+            ops.append(
+                f"BT {r:.6g} {g:.6g} {b:.6g} rg {font_name} {PAGE_NUMBER_SIZE} Tf "
+                f"1 0 0 1 {x:.4f} {0.15*inch:.4f} Tm ({label}) Tj ET".encode('ascii'))
+            resources[NameObject('/Font')] = DictionaryObject({
+                NameObject(font_name): self.page_number_font(),
+            })
+
+        if ctm != IDENTITY:
+            matrix = ' '.join(f'{value:.6g}' for value in ctm)
+            ops = [f'q {matrix} cm'.encode('ascii')] + ops + [b'Q']
+        return b'\n'.join(ops), resources
+
+    def overlay_page(self, page_num, total_pages, branding_config, pagesize=letter,
+                     ctm=IDENTITY):
+        """Build the lightweight overlay page for one page of the document."""
+        data, resources = self.overlay_content(page_num, total_pages, branding_config,
+                                               pagesize, ctm)
+        content = DecodedStreamObject()
+        content.set_data(data)
+        page = PageObject.create_blank_page(width=pagesize[0], height=pagesize[1])
+        page[NameObject('/Resources')] = resources
+        page[NameObject('/Contents')] = content
+        return page
+
+def _brand_page(page, page_num, total_pages, branding_config, overlays=None):
+    """Merge the branding overlay into ``page`` in place.
+
+    The overlay is sized to the page's visible box and rotation, so mixed
+    A4, legal and landscape pages need no normalizing pass.
+    """
+    pagesize, ctm = _page_geometry(page)
+    with instrument.stage('overlay_render', page=page_num, cached=overlays is not None):
+        if overlays is not None:
+            overlay_page = overlays.overlay_page(page_num, total_pages, branding_config,
+                                                 pagesize, ctm)
+        else:
+            overlay_packet = create_overlay(page_num, total_pages, branding_config, pagesize)
+            overlay_reader = PdfReader(overlay_packet)
+            overlay_page = overlay_reader.pages[0]
+            if ctm != IDENTITY:
+                overlay_page.add_transformation(Transformation(ctm))
+
+    with instrument.stage('merge', page=page_num):
+        if ctm != IDENTITY:
+            # merge_page clips the overlay to its own box, taken in this page's space
+            overlay_page.mediabox = page.cropbox
+        page.merge_page(overlay_page)
+
+def _metadata(branding_config):
+    """Document info dictionary entries for a rebranded PDF."""
+    return {
         '/Title': branding_config.get('title', 'Rebranded Document'),
         '/Author': branding_config.get('company', 'Your Company'),
         '/Subject': branding_config.get('subject', 'Business Document'),
         '/Creator': 'PDF Rebranding Tool',
         '/Producer': 'PyPDF2 + ReportLab'
-    })
+    }
+
+def _add_metadata(writer, branding_config):
+    """Set the document info dictionary of a rebranded PDF."""
+    writer.add_metadata(_metadata(branding_config))
+
+def _page_ranges(total_pages, shards):
+    """Split ``range(total_pages)`` into at most ``shards`` contiguous ranges."""
+    shards = max(1, min(shards, total_pages))
+    size, extra = divmod(total_pages, shards)
+    ranges, start = [], 0
+    for i in range(shards):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+# First object number of the placeholders that stand for branding objects in shard results
+SHARD_TOKEN_BASE = 10**9
+
+def _portable(obj, reader, tokens, index):
+    """Copy ``obj`` so it can be re-read against another reader of the same file.
+
+    References to ``reader`` keep their object numbers, which every reader
+    of the input shares. Branding forms and the page number font become
+    placeholder references to ``SHARD_TOKEN_BASE + i`` for ``tokens[i]``,
+    looked up through ``index`` (object number -> token). Other objects,
+    such as the fonts of a per-page overlay, are inlined.
+    """
+    if isinstance(obj, IndirectObject):
+        if obj.pdf is reader:
+            return obj
+        if obj.idnum in index:
+            token = index[obj.idnum]
+            if token not in tokens:
+                tokens.append(token)
+            return IndirectObject(SHARD_TOKEN_BASE + tokens.index(token), 0, None)
+        return _portable(obj.get_object(), reader, tokens, index)
+    if isinstance(obj, DictionaryObject):
+        return DictionaryObject({key: _portable(value, reader, tokens, index)
+                                 for key, value in obj.items()})
+    if isinstance(obj, ArrayObject):
+        return ArrayObject(_portable(value, reader, tokens, index) for value in obj)
+    return obj
+
+def _rebrand_shard(task):
+    """Worker: brand one page range, returning each page's new content and resources.
+
+    Only what branding changed is sent back: the merged content stream and
+    the resources dictionary, serialized with ``_portable``. The parent
+    attaches them to its own copy of the pages, so fonts and images the
+    pages share are written once rather than once per shard.
+    """
+    input_path, start, stop, total_pages, branding_config, cache_overlays = task
+    _load_pdf_libs()
+    reader = PdfReader(input_path)
+    writer = PdfWriter()
+    overlays = OverlayCache(writer) if cache_overlays else None
+
+    pages, tokens = [], []
+    for index in range(start, stop):
+        page = reader.pages[index]
+        _brand_page(page, index + 1, total_pages, branding_config, overlays)
+        index_map = {}
+        if overlays is not None:
+            index_map = {ref.idnum: ('form', key) for key, ref in overlays._forms.items()}
+            if overlays._font is not None:
+                index_map[overlays._font.idnum] = ('font',)
+        resources = BytesIO()
+        _portable(page['/Resources'], reader, tokens, index_map).write_to_stream(resources, None)
+        pages.append((page.get_contents().get_data(), resources.getvalue()))
+    return start, stop, pages, tokens
+
+def _attach_shard_page(page, contents, resources, tokens, overlays):
+    """Give ``page`` the content and resources a shard worker produced for it."""
+    resolved = [overlays.form(dict(token[1][0]), token[1][1]) if token[0] == 'form'
+                else overlays.page_number_font() for token in tokens]
+
+    def restore(obj):
+        if isinstance(obj, IndirectObject) and obj.idnum >= SHARD_TOKEN_BASE:
+            return resolved[obj.idnum - SHARD_TOKEN_BASE]
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({key: restore(value) for key, value in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(restore(value) for value in obj)
+        return obj
+
+    content = DecodedStreamObject()
+    content.set_data(contents)
+    page[NameObject('/Contents')] = content
+    page[NameObject('/Resources')] = restore(read_object(BytesIO(resources), page.pdf))
+
+class StreamingPdfWriter:
+    """Write a PDF incrementally, one page at a time.
+
+    Unlike ``PdfWriter``, which keeps every page in memory until ``write()``,
+    each page and the objects it references are serialized as soon as they are
+    added. Only the xref offsets and a map of already-written source objects
+    are kept, so memory stays flat regardless of the page count.
+    """
+
+    def __init__(self, stream):
+        _load_pdf_libs()
+        self.stream = stream
+        self._offsets = [None]      # indexed by object number
+        self._translated = {}       # (id(source pdf), idnum, generation) -> number
+        self._page_numbers = []
+        self.stream.write(b'%PDF-1.7\n%\xe2\xe3\xcf\xd3\n')
+        self._pages_root = self._reserve()
+
+    def _reserve(self):
+        self._offsets.append(None)
+        return len(self._offsets) - 1
+
+    def _ref(self, number):
+        return IndirectObject(number, 0, self)
+
+    def _write(self, number, obj, generation=0):
+        self._offsets[number] = self.stream.tell()
+        self.stream.write(f"{number} {generation} obj\n".encode('ascii'))
+        obj.write_to_stream(self.stream, None)
+        self.stream.write(b"\nendobj\n")
+
+    def _copy(self, obj):
+        """Copy ``obj`` for output, writing out any objects it references."""
+        if isinstance(obj, IndirectObject):
+            if obj.pdf is self:
+                return obj
+            key = (id(obj.pdf), obj.idnum, obj.generation)
+            if key not in self._translated:
+                target = obj.get_object()
+                if isinstance(target, DictionaryObject) and target.get('/Type') == '/Pages':
+                    return self._ref(self._pages_root)
+                # Reserve the number first so reference cycles terminate
+                self._translated[key] = self._reserve()
+                self._emit(self._translated[key], target)
+            return self._ref(self._translated[key])
+        if isinstance(obj, StreamObject):
+            # Streams must be indirect; merged content streams are direct
+            number = self._reserve()
+            self._emit(number, obj)
+            return self._ref(number)
+        if isinstance(obj, DictionaryObject):
+            return DictionaryObject({key: self._copy(value) for key, value in obj.items()})
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self._copy(value) for value in obj)
+        return obj
+
+    def _emit(self, number, obj):
+        if isinstance(obj, StreamObject):
+            if isinstance(obj, EncodedStreamObject):
+                copy = EncodedStreamObject()
+                copy._data = obj._data      # still compressed, never decoded
+            else:
+                copy = DecodedStreamObject()
+                copy.set_data(obj.get_data())
+            for key, value in obj.items():
+                if key != '/Length':
+                    copy[key] = self._copy(value)
+        else:
+            copy = self._copy(obj) if isinstance(obj, (DictionaryObject, ArrayObject)) else obj
+        self._write(number, copy)
+
+    def reserve_pages(self, pages):
+        """Pre-assign object numbers to source pages so cross-page links resolve."""
+        for page in pages:
+            ref = page.indirect_reference
+            if ref is not None:
+                self._translated[(id(ref.pdf), ref.idnum, ref.generation)] = self._reserve()
+
+    def add_object(self, obj):
+        """Write ``obj`` immediately and return an indirect reference to it."""
+        number = self._reserve()
+        self._emit(number, obj)
+        return self._ref(number)
+
+    def add_page(self, page):
+        """Serialize ``page`` and everything it references."""
+        ref = page.indirect_reference
+        key = ref and (id(ref.pdf), ref.idnum, ref.generation)
+        number = self._translated.get(key) or self._reserve()
+        copy = DictionaryObject({
+            name: self._copy(value) for name, value in page.items() if name != '/Parent'
+        })
+        copy[NameObject('/Parent')] = self._ref(self._pages_root)
+        self._write(number, copy)
+        self._page_numbers.append(number)
+
+    def close(self, metadata):
+        """Write the page tree, catalog, info dictionary, xref and trailer."""
+        self._write(self._pages_root, DictionaryObject({
+            NameObject('/Type'): NameObject('/Pages'),
+            NameObject('/Kids'): ArrayObject(self._ref(n) for n in self._page_numbers),
+            NameObject('/Count'): NumberObject(len(self._page_numbers)),
+        }))
+        catalog = self.add_object(DictionaryObject({
+            NameObject('/Type'): NameObject('/Catalog'),
+            NameObject('/Pages'): self._ref(self._pages_root),
+        }))
+        info = self.add_object(DictionaryObject({
+            NameObject(key): create_string_object(value) for key, value in metadata.items()
+        }))
+
+        xref = self.stream.tell()
+        self.stream.write(f"xref\n0 {len(self._offsets)}\n".encode('ascii'))
+        self.stream.write(b"0000000000 65535 f \n")
+        for offset in self._offsets[1:]:
+            self.stream.write(f"{offset:010d} 00000 n \n".encode('ascii'))
+        self.stream.write(b"trailer\n")
+        DictionaryObject({
+            NameObject('/Size'): NumberObject(len(self._offsets)),
+            NameObject('/Root'): catalog,
+            NameObject('/Info'): info,
+        }).write_to_stream(self.stream, None)
+        self.stream.write(f"\nstartxref\n{xref}\n%%EOF\n".encode('ascii'))
+
+def _page_copy(reader, source):
+    """Shallow copy of a source page that branding can modify in place.
+
+    Branding only replaces the page's own entries, so objects the page
+    references stay shared with the reader and are never modified.
+    """
+    page = PageObject(reader, source.indirect_reference)
+    page.update(source)
+    return page
+
+def _rebrand_streaming(input_path, output_path, branding_config, cache_overlays):
+    """Rebrand page by page with bounded memory.
+
+    The input is read through an open file handle rather than loaded whole,
+    each merged page is written out immediately, and the reader's object
+    cache is dropped every ``STREAM_CHUNK_PAGES`` pages.
+    """
+    with open(input_path, 'rb') as input_file, open(output_path, 'wb') as output_file:
+        reader = PdfReader(input_file)
+        writer = StreamingPdfWriter(output_file)
+        overlays = OverlayCache(writer) if cache_overlays else None
+        total_pages = len(reader.pages)
+        writer.reserve_pages(reader.pages)
+
+        print(f"Processing {total_pages} pages (streaming)...")
+
+        for index in range(total_pages):
+            # Merge into a shallow copy so the reader's page list stays small
+            source = reader.pages[index]
+            page = _page_copy(reader, source)
+            _brand_page(page, index + 1, total_pages, branding_config, overlays)
+            writer.add_page(page)
+            del page, source
+
+            if (index + 1) % STREAM_CHUNK_PAGES == 0:
+                reader.resolved_objects.clear()
+                output_file.flush()
+            if (index + 1) % 10 == 0:
+                print(f"  Processed {index + 1}/{total_pages} pages")
+
+        writer.close(_metadata(branding_config))
+
+def _object_count(reader):
+    """One more than the highest object number in ``reader``.
+
+    PyPDF2 drops ``/Size`` from the trailer of files with cross-reference
+    streams, so the number is taken from the xref entries it has read,
+    including objects stored in object streams.
+    """
+    numbers = [number for entries in reader.xref.values() for number in entries]
+    numbers.extend(reader.xref_objStm)
+    size = max(numbers, default=0) + 1
+    if '/Size' in reader.trailer:
+        size = max(size, int(reader.trailer['/Size']))
+    return size
+
+class IncrementalPdfWriter(StreamingPdfWriter):
+    """Append an incremental update to a byte-for-byte copy of a PDF.
+
+    The source file is copied unchanged and only new or replaced objects are
+    written after it, so original content streams and images are never
+    decoded or re-serialized. Source objects keep their numbers: references
+    to them are written as they are, and a replaced page is rewritten under
+    its own number. ``close()`` appends a cross-reference section of the same
+    kind as the source's (table or stream) whose ``/Prev`` points back at it.
+    """
+
+    # Field widths of the cross-reference stream rows: type, offset, generation
+    XREF_WIDTHS = (1, 8, 2)
+
+    def __init__(self, stream, reader, source):
+        _load_pdf_libs()
+        self.stream = stream
+        self.reader = reader
+        self._offsets = [None] * _object_count(reader)
+        self._generations = {}
+        self._translated = {}
+
+        # Inspect the source's last xref section before writing anything
+        end = source.seek(0, 2)
+        source.seek(max(0, end - 1024))
+        tail = source.read()
+        self._prev = int(re.findall(rb'startxref\s+(\d+)', tail)[-1])
+        source.seek(self._prev)
+        self._xref_stream = not source.read(4).startswith(b'xref')
+
+        source.seek(0)
+        shutil.copyfileobj(source, stream)
+        if not tail.endswith((b'\n', b'\r')):
+            stream.write(b'\n')
+
+    def _copy(self, obj):
+        if isinstance(obj, IndirectObject) and obj.pdf is self.reader:
+            return obj
+        return super()._copy(obj)
+
+    def add_page(self, page):
+        """Rewrite ``page`` under its own object number."""
+        ref = page.indirect_reference
+        self._generations[ref.idnum] = ref.generation
+        self._write(ref.idnum, DictionaryObject({
+            name: self._copy(value) for name, value in page.items()
+        }), ref.generation)
+
+    def _sections(self):
+        """``(first, count)`` runs of consecutive object numbers written by this update."""
+        runs = []
+        for number, offset in enumerate(self._offsets):
+            if offset is None:
+                continue
+            if runs and runs[-1][0] + runs[-1][1] == number:
+                runs[-1][1] += 1
+            else:
+                runs.append([number, 1])
+        return runs
+
+    def close(self, metadata):
+        """Write the info dictionary, the update's xref section and trailer."""
+        info = self.add_object(DictionaryObject({
+            NameObject(key): create_string_object(value) for key, value in metadata.items()
+        }))
+        trailer = DictionaryObject({
+            NameObject('/Root'): self.reader.trailer.raw_get('/Root'),
+            NameObject('/Info'): info,
+            NameObject('/Prev'): NumberObject(self._prev),
+        })
+        if '/ID' in self.reader.trailer:
+            trailer[NameObject('/ID')] = self.reader.trailer['/ID']
+
+        if self._xref_stream:
+            # The xref stream lists itself, so it takes a number before its offset is known
+            number = self._reserve()
+            xref = self._offsets[number] = self.stream.tell()
+            rows = b''.join(
+                b'\x01' + self._offsets[n].to_bytes(self.XREF_WIDTHS[1], 'big')
+                + self._generations.get(n, 0).to_bytes(self.XREF_WIDTHS[2], 'big')
+                for first, count in self._sections() for n in range(first, first + count))
+            xref_stream = DecodedStreamObject()
+            xref_stream.set_data(rows)
+            xref_stream.update(trailer)
+            xref_stream.update({
+                NameObject('/Type'): NameObject('/XRef'),
+                NameObject('/Size'): NumberObject(len(self._offsets)),
+                NameObject('/Index'): ArrayObject(
+                    NumberObject(value) for run in self._sections() for value in run),
+                NameObject('/W'): ArrayObject(NumberObject(w) for w in self.XREF_WIDTHS),
+            })
+            self._write(number, xref_stream)
+        else:
+            xref = self.stream.tell()
+            # Lead with the free head of the list, as readers expect a table to start at 0
+            self.stream.write(b"xref\n0 1\n0000000000 65535 f \n")
+            for first, count in self._sections():
+                self.stream.write(f"{first} {count}\n".encode('ascii'))
+                for n in range(first, first + count):
+                    self.stream.write(f"{self._offsets[n]:010d} "
+                                      f"{self._generations.get(n, 0):05d} n \n".encode('ascii'))
+            self.stream.write(b"trailer\n")
+            trailer[NameObject('/Size')] = NumberObject(len(self._offsets))
+            trailer.write_to_stream(self.stream, None)
+            self.stream.write(b"\n")
+        self.stream.write(f"startxref\n{xref}\n%%EOF\n".encode('ascii'))
+
+def _resource_suffix(resources):
+    """Suffix that keeps the overlay's resource names clear of the page's own."""
+    used = set()
+    for category in ('/XObject', '/Font'):
+        if category in resources:
+            used.update(resources[category].keys())
+    n = 0
+    while {f'/BrandOverlay{n or ""}', f'/BrandPageFont{n or ""}'} & used:
+        n += 1
+    return str(n or '')
+
+def _append_overlay(page, page_num, total_pages, branding_config, overlays, state):
+    """Add the overlay to ``page`` as an extra content stream.
+
+    The page's own streams are kept by reference, bracketed by a shared
+    ``q`` stream before and the overlay (after a ``Q``) so whatever state
+    they leave behind does not leak into the branding. Merged resources are
+    written once per shared resource dictionary.
+    """
+    writer = overlays.writer
+    pagesize, ctm = _page_geometry(page)
+    resources = page['/Resources'] if '/Resources' in page else DictionaryObject()
+    suffix = _resource_suffix(resources)
+    data, extra = overlays.overlay_content(page_num, total_pages, branding_config,
+                                           pagesize, ctm, suffix)
+
+    source = page.raw_get('/Resources') if '/Resources' in page else None
+    key = isinstance(source, IndirectObject) and (source.idnum, pagesize, ctm, suffix)
+    if key and key in state['resources']:
+        merged = state['resources'][key]
+    else:
+        merged = DictionaryObject(resources)
+        for category, entries in extra.items():
+            combined = DictionaryObject(resources[category]) if category in resources \
+                else DictionaryObject()
+            combined.update(entries)
+            merged[NameObject(category)] = combined
+        if key:
+            merged = state['resources'][key] = writer.add_object(merged)
+
+    streams = []
+    if '/Contents' in page:
+        contents = page.raw_get('/Contents')
+        target = contents.get_object()
+        streams = list(target) if isinstance(target, ArrayObject) else [contents]
+    if 'save' not in state:
+        save = DecodedStreamObject()
+        save.set_data(b'q\n')
+        state['save'] = writer.add_object(save)
+    overlay = DecodedStreamObject()
+    overlay.set_data(b'\nQ\n' + data)
+
+    page[NameObject('/Resources')] = merged
+    page[NameObject('/Contents')] = ArrayObject(
+        [state['save'], *streams, writer.add_object(overlay)])
+    writer.add_page(page)
+
+def _rebrand_incremental(input_path, output_path, branding_config):
+    """Brand every page as an incremental update; returns the page count.
+
+    Only the page dictionaries are parsed: each gets the shared branding
+    form and a few bytes of content appended, and everything else in the
+    file, including every image, is carried over as raw bytes.
+    """
+    with open(input_path, 'rb') as input_file:
+        reader = PdfReader(input_file)
+        if reader.is_encrypted:
+            raise ValueError("encrypted PDFs cannot be updated incrementally")
+        with open(output_path, 'wb') as output_file:
+            _write_incremental(reader, input_file, output_file, branding_config)
+    return len(reader.pages)
+
+def _write_incremental(reader, source, output_file, branding_config):
+    """Copy ``source`` to ``output_file`` and append the branding for every page."""
+    writer = IncrementalPdfWriter(output_file, reader, source)
+    overlays = OverlayCache(writer)
+    total_pages = len(reader.pages)
+    state = {'resources': {}}
+
+    print(f"Processing {total_pages} pages (incremental update)...")
+
+    for index in range(total_pages):
+        with instrument.stage('append', page=index + 1):
+            _append_overlay(reader.pages[index], index + 1, total_pages,
+                            branding_config, overlays, state)
+        if (index + 1) % STREAM_CHUNK_PAGES == 0:
+            reader.resolved_objects.clear()
+        if (index + 1) % 10 == 0:
+            print(f"  Processed {index + 1}/{total_pages} pages")
+
+    writer.close(_metadata(branding_config))
+
+def rebrand_pdf(input_path, output_path, branding_config, cache_overlays=True, jobs=1,
+                stream=False, incremental=False):
+    """Rebrand an existing PDF with new styling.
+
+    With ``cache_overlays`` the static branding is shared between pages as a
+    form XObject; otherwise a full overlay is rendered for every page.
+
+    With ``jobs`` > 1 the document is split into contiguous page ranges that
+    are branded in a process pool and stitched back together in page order.
+
+    With ``stream`` pages are read lazily and written as they are merged, so
+    peak memory does not grow with the page count.
+
+    With ``incremental`` nothing is merged: the input is copied as is and the
+    branding appended to it as an incremental update.
+    """
+    _load_pdf_libs()
+    start_time = time.perf_counter()
+    print(f"Rebranding PDF: {input_path}")
+
+    if incremental:
+        total_pages = _rebrand_incremental(input_path, output_path, branding_config)
+        instrument.record('rebrand_pdf', time.perf_counter() - start_time,
+                          input=input_path, pages=total_pages, mode='incremental')
+        print(f"✓ Rebranded PDF saved to: {output_path}")
+        return
+
+    if stream:
+        _rebrand_streaming(input_path, output_path, branding_config, cache_overlays)
+        instrument.record('rebrand_pdf', time.perf_counter() - start_time,
+                          input=input_path, mode='stream')
+        print(f"✓ Rebranded PDF saved to: {output_path}")
+        return
+
+    # Read input PDF
+    with instrument.stage('read', input=input_path):
+        reader = PdfReader(input_path)
+        writer = PdfWriter()
+        total_pages = len(reader.pages)
+
+    print(f"Processing {total_pages} pages...")
+
+    if jobs > 1 and total_pages > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # A few shards per worker keeps the pool busy when pages differ in cost
+        tasks = [(str(input_path), start, stop, total_pages, branding_config, cache_overlays)
+                 for start, stop in _page_ranges(total_pages, jobs * 4)]
+        overlays = OverlayCache(writer)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for start, stop, pages, tokens in executor.map(_rebrand_shard, tasks):
+                for index, (contents, resources) in enumerate(pages, start=start):
+                    page = reader.pages[index]
+                    _attach_shard_page(page, contents, resources, tokens, overlays)
+                    writer.add_page(page)
+                print(f"  Processed {stop}/{total_pages} pages")
+    else:
+        overlays = OverlayCache(writer) if cache_overlays else None
+        for page_num, page in enumerate(reader.pages, start=1):
+            # Merge original page with overlay
+            _brand_page(page, page_num, total_pages, branding_config, overlays)
+            writer.add_page(page)
+
+            if page_num % 10 == 0:
+                print(f"  Processed {page_num}/{total_pages} pages")
+
+    # Add metadata
+    _add_metadata(writer, branding_config)
 
     # Write output
-    with open(output_path, 'wb') as output_file:
-        writer.write(output_file)
+    with instrument.stage('write', output=output_path):
+        with open(output_path, 'wb') as output_file:
+            writer.write(output_file)
 
+    instrument.record('rebrand_pdf', time.perf_counter() - start_time, input=input_path,
+                      pages=total_pages, jobs=jobs)
     print(f"✓ Rebranded PDF saved to: {output_path}")
 
 def create_sample_pdf(output_path):
@@ -192,6 +937,322 @@ def create_sample_pdf(output_path):
     doc.build(story)
     print(f"✓ Created sample PDF: {output_path}")
 
+def make_branding_config(company='Anthropic Ventures', doc_type='Business Plan',
+                         watermark=False, watermark_text='DRAFT',
+                         header=True, footer=True, accent_bar=True):
+    """Build a branding config dict from CLI-style options."""
+    return {
+        'company': company,
+        'document_type': doc_type,
+        'watermark': watermark,
+        'watermark_text': watermark_text,
+        'header': header,
+        'footer': footer,
+        'accent_bar': accent_bar,
+        'title': f'{doc_type} - {company}'
+    }
+
+def _parse_bool(value):
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'y', 'on')
+
+def _manifest_row(row):
+    """Strip a CSV manifest row, dropping empty cells."""
+    return {k.strip(): v.strip() for k, v in row.items() if k and v and v.strip()}
+
+def _manifest_options(row, defaults):
+    """``make_branding_config`` options from a manifest row, over ``defaults``."""
+    options = dict(defaults)
+    for key in ('company', 'doc_type', 'watermark_text'):
+        if key in row:
+            options[key] = row[key]
+    for key in ('watermark', 'header', 'footer', 'accent_bar'):
+        if key in row:
+            options[key] = _parse_bool(row[key])
+    return options
+
+def collect_batch_jobs(source, output_dir=None, defaults=None):
+    """Expand a batch source into ``(input, output, branding_config)`` rows.
+
+    ``source`` may be a directory (every ``*.pdf`` in it), a glob pattern, or
+    a CSV manifest with an ``input`` column and optional ``output``,
+    ``company``, ``doc_type``, ``watermark``, ``watermark_text``, ``header``,
+    ``footer`` and ``accent_bar`` columns. Options missing from a manifest row
+    fall back to ``defaults``.
+    """
+    defaults = defaults or {}
+    output_dir = Path(output_dir) if output_dir else None
+
+    def output_for(input_path):
+        directory = output_dir or input_path.parent
+        return directory / f"{input_path.stem}_rebranded.pdf"
+
+    source_path = Path(source)
+    if source_path.is_dir():
+        inputs = sorted(source_path.glob('*.pdf'))
+    elif source_path.suffix.lower() == '.csv' and source_path.is_file():
+        jobs = []
+        with open(source_path, newline='') as f:
+            for row in csv.DictReader(f):
+                row = _manifest_row(row)
+                input_path = source_path.parent / row['input']
+                if 'output' in row:
+                    output_path = source_path.parent / row['output']
+                else:
+                    output_path = output_for(input_path)
+                jobs.append((input_path, output_path,
+                             make_branding_config(**_manifest_options(row, defaults))))
+        return jobs
+    else:
+        inputs = sorted(Path(p) for p in glob.glob(str(source), recursive=True))
+
+    branding_config = make_branding_config(**defaults)
+    return [(p, output_for(p), branding_config) for p in inputs
+            if not p.stem.endswith('_rebranded')]
+
+def _init_batch_worker():
+    """Warm a batch worker by loading the libraries and standard font metrics once."""
+    _load_pdf_libs()
+    for font in (PAGE_NUMBER_FONT, 'Helvetica-Bold'):
+        stringWidth('0', font, PAGE_NUMBER_SIZE)
+
+def _rebrand_batch_item(job):
+    """Worker: rebrand one file, returning its latency or the error."""
+    input_path, output_path, branding_config, cache_overlays, incremental = job
+    start = time.perf_counter()
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        with redirect_stdout(StringIO()):
+            rebrand_pdf(input_path, output_path, branding_config,
+                        cache_overlays=cache_overlays, incremental=incremental)
+        error = None
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return input_path, output_path, time.perf_counter() - start, error
+
+def rebrand_batch(jobs, workers=1, cache_overlays=True, incremental=False):
+    """Rebrand many files through one long-lived worker pool.
+
+    Workers stay up for the whole batch, so imports, font metrics and overlay
+    templates are loaded once per worker rather than once per file. Returns
+    the number of files that failed.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    total = len(jobs)
+    print(f"Rebranding {total} files with {workers} workers...")
+    tasks = [(i, o, config, cache_overlays, incremental) for i, o, config in jobs]
+    latencies, failures = [], 0
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, workers),
+                             initializer=_init_batch_worker) as executor:
+        futures = [executor.submit(_rebrand_batch_item, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), start=1):
+            input_path, output_path, latency, error = future.result()
+            if error:
+                failures += 1
+                print(f"  ✗ [{done}/{total}] {input_path}: {error}")
+            else:
+                latencies.append(latency)
+                print(f"  ✓ [{done}/{total}] {input_path} -> {output_path} "
+                      f"({latency*1000:.0f} ms)")
+    elapsed = time.perf_counter() - start
+
+    if latencies:
+        latencies.sort()
+        median = latencies[len(latencies) // 2]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"\nLatency: median {median*1000:.0f} ms, p95 {p95*1000:.0f} ms, "
+              f"max {latencies[-1]*1000:.0f} ms")
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"{'✗' if failures else '✓'} Rebranded {total - failures}/{total} files "
+          f"in {elapsed:.2f}s ({rate:.1f} files/s)")
+    if failures:
+        print(f"✗ {failures} {'file' if failures == 1 else 'files'} failed")
+    return failures
+
+# Source document shared by fan-out workers; forked workers inherit it parsed
+_fanout_reader = None
+
+def _resolve_pages(reader):
+    """Resolve every object the pages reference, so they are parsed only once."""
+    seen = set()
+    stack = list(reader.pages)
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, IndirectObject):
+            if (obj.idnum, obj.generation) in seen:
+                continue
+            seen.add((obj.idnum, obj.generation))
+            obj = obj.get_object()
+        if isinstance(obj, DictionaryObject):
+            stack.extend(value for key, value in obj.items() if key != '/Parent')
+        elif isinstance(obj, ArrayObject):
+            stack.extend(obj)
+
+def _load_fanout_source(input_path):
+    """Parse the fan-out input once per process and return its reader."""
+    global _fanout_reader
+    _load_pdf_libs()
+    if _fanout_reader is None:
+        with instrument.stage('read', input=str(input_path)):
+            _fanout_reader = PdfReader(str(input_path))
+            if _fanout_reader.is_encrypted:
+                raise ValueError("encrypted PDFs cannot be fanned out")
+            _resolve_pages(_fanout_reader)
+    return _fanout_reader
+
+def _init_fanout_worker(input_path):
+    """Warm a fan-out worker; only workers that were not forked parse the input."""
+    _init_batch_worker()
+    _load_fanout_source(input_path)
+
+def _brand_variant(reader, output_path, branding_config, cache_overlays, incremental):
+    """Write one branded variant of the shared ``reader`` to ``output_path``."""
+    total_pages = len(reader.pages)
+    if incremental:
+        with open(output_path, 'wb') as output_file:
+            # A reader opened from a path holds the whole file, so copy from it
+            writer = IncrementalPdfWriter(output_file, reader, reader.stream)
+            overlays = OverlayCache(writer)
+            state = {'resources': {}}
+            for index, source in enumerate(reader.pages):
+                with instrument.stage('append', page=index + 1):
+                    _append_overlay(_page_copy(reader, source), index + 1, total_pages,
+                                    branding_config, overlays, state)
+            writer.close(_metadata(branding_config))
+        return
+
+    writer = PdfWriter()
+    overlays = OverlayCache(writer) if cache_overlays else None
+    for index, source in enumerate(reader.pages):
+        page = _page_copy(reader, source)
+        _brand_page(page, index + 1, total_pages, branding_config, overlays)
+        writer.add_page(page)
+    _add_metadata(writer, branding_config)
+    with instrument.stage('write', output=str(output_path)):
+        with open(output_path, 'wb') as output_file:
+            writer.write(output_file)
+
+def _rebrand_fanout_item(task):
+    """Worker: brand one variant of the shared input.
+
+    Returns the variant's latency and CPU time, or the error.
+    """
+    input_path, output_path, branding_config, cache_overlays, incremental = task
+    start, cpu = time.perf_counter(), time.process_time()
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        _brand_variant(_load_fanout_source(input_path), output_path, branding_config,
+                       cache_overlays, incremental)
+        error = None
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    return (output_path, time.perf_counter() - start, time.process_time() - cpu, error)
+
+def _slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'brand'
+
+def collect_brands(source, input_path, output_dir=None, defaults=None):
+    """Read a CSV manifest of branding variants into ``(output, branding_config)`` rows.
+
+    Each row is one variant of ``input_path``, with optional ``output``,
+    ``company``, ``doc_type``, ``watermark``, ``watermark_text``, ``header``,
+    ``footer`` and ``accent_bar`` columns; missing options fall back to
+    ``defaults``. Without an ``output`` column a variant is written to
+    ``<input stem>_<company>.pdf`` in ``output_dir`` (default: next to the input).
+    """
+    defaults = defaults or {}
+    source_path, input_path = Path(source), Path(input_path)
+    directory = Path(output_dir) if output_dir else input_path.parent
+    brands, used = [], set()
+    with open(source_path, newline='') as f:
+        for row in csv.DictReader(f):
+            row = _manifest_row(row)
+            branding_config = make_branding_config(**_manifest_options(row, defaults))
+            if 'output' in row:
+                output_path = source_path.parent / row['output']
+            else:
+                name = slug = _slug(branding_config['company'])
+                n = 1
+                while name in used:
+                    n += 1
+                    name = f"{slug}-{n}"
+                used.add(name)
+                output_path = directory / f"{input_path.stem}_{name}.pdf"
+            brands.append((output_path, branding_config))
+    return brands
+
+def rebrand_fanout(input_path, brands, workers=1, cache_overlays=True, incremental=False):
+    """Brand one input into several variants from a single parse.
+
+    The input is parsed once and every object its pages reference resolved
+    up front, together with the overlay template of each variant and page
+    size. Variants are then branded from shallow page copies, in this
+    process or, with ``workers`` > 1, in a pool whose forked workers inherit
+    the parsed document and templates. Returns the number of variants that
+    failed.
+    """
+    global _fanout_reader
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    total = len(brands)
+    print(f"Rebranding {input_path} into {total} variants with {workers} workers...")
+    start, cpu = time.perf_counter(), time.process_time()
+    _fanout_reader = None
+    reader = _load_fanout_source(input_path)
+    sizes = {_page_geometry(page)[0] for page in reader.pages}
+    keys = {_overlay_key(config, size) for _, config in brands for size in sizes}
+    if cache_overlays and len(keys) <= _overlay_template.cache_info().maxsize:
+        for key in keys:
+            _overlay_template(key)
+    prepared = time.process_time() - cpu
+    print(f"  Parsed {len(reader.pages)} pages and {len(keys)} templates "
+          f"in {(time.perf_counter() - start)*1000:.0f} ms")
+
+    tasks = [(str(input_path), output_path, config, cache_overlays, incremental)
+             for output_path, config in brands]
+    variant_cpu, failures = [], 0
+
+    def report(done, output_path, latency, cpu_time, error):
+        nonlocal failures
+        if error:
+            failures += 1
+            print(f"  ✗ [{done}/{total}] {output_path}: {error}")
+        else:
+            variant_cpu.append(cpu_time)
+            print(f"  ✓ [{done}/{total}] {output_path} ({latency*1000:.0f} ms)")
+
+    if workers > 1 and total > 1:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork') if 'fork' in methods else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_init_fanout_worker,
+                                 initargs=(str(input_path),)) as executor:
+            futures = [executor.submit(_rebrand_fanout_item, task) for task in tasks]
+            for done, future in enumerate(as_completed(futures), start=1):
+                report(done, *future.result())
+    else:
+        for done, task in enumerate(tasks, start=1):
+            report(done, *_rebrand_fanout_item(task))
+    elapsed = time.perf_counter() - start
+    _fanout_reader = None
+
+    # Separate runs would each parse the input and render their own templates,
+    # then do the same branding work; CPU time stays comparable across workers
+    if variant_cpu:
+        baseline = sum(variant_cpu) + prepared * len(variant_cpu)
+        print(f"\nSeparate runs (estimated): {baseline:.2f}s; fan-out: {elapsed:.2f}s "
+              f"({baseline / elapsed:.1f}x)")
+    print(f"{'✗' if failures else '✓'} Rebranded {total - failures}/{total} variants "
+          f"in {elapsed:.2f}s")
+    if failures:
+        print(f"✗ {failures} {'variant' if failures == 1 else 'variants'} failed")
+    instrument.record('rebrand_fanout', elapsed, input=str(input_path), variants=total,
+                      workers=workers, mode='incremental' if incremental else 'merge')
+    return failures
+
 def main():
     parser = argparse.ArgumentParser(
         description='Rebrand existing PDFs with new corporate styling'
@@ -205,10 +1266,42 @@ def main():
     parser.add_argument('--no-header', action='store_true', help='Disable header')
     parser.add_argument('--no-footer', action='store_true', help='Disable footer')
     parser.add_argument('--no-accent', action='store_true', help='Disable accent bar')
+    parser.add_argument('--no-overlay-cache', action='store_true',
+                       help='Render a full overlay for every page instead of sharing one template')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                       help='Number of worker processes for page-range sharding, '
+                            'or the pool size with --batch (default: 1)')
+    parser.add_argument('--stream', action='store_true',
+                       help='Write pages as they are merged to keep memory flat on huge PDFs')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Append the branding as an incremental update instead of '
+                            'rewriting every page')
+    parser.add_argument('--batch', metavar='SOURCE',
+                       help='Rebrand a directory, glob pattern or CSV manifest of PDFs')
+    parser.add_argument('--brands', metavar='MANIFEST',
+                       help='Brand the input once per row of a CSV manifest of branding '
+                            'options, parsing it only once')
+    parser.add_argument('--output-dir', help='Output directory for --batch and --brands '
+                       '(default: next to each input)')
     parser.add_argument('--create-sample', action='store_true',
                        help='Create sample PDF for demonstration')
+    parser.add_argument('--timings', metavar='FILE',
+                       help='Append per-stage timings and peak memory as JSON lines '
+                            '(default: $BUILD_TIMINGS)')
+    parser.add_argument('--profile', metavar='FILE',
+                       help='Profile the run: .html uses pyinstrument, otherwise cProfile stats')
 
     args = parser.parse_args()
+    if args.timings:
+        instrument.configure(args.timings)
+    if args.stream and args.jobs > 1 and not args.batch:
+        parser.error('--stream and --jobs cannot be combined')
+    if args.brands and (args.batch or args.stream or args.output):
+        parser.error('--brands cannot be combined with --batch, --stream or --output')
+    if args.incremental and (args.stream or args.no_overlay_cache
+                             or (args.jobs > 1 and not (args.batch or args.brands))):
+        parser.error('--incremental cannot be combined with --stream, --no-overlay-cache '
+                     'or --jobs (except with --batch or --brands)')
 
     # Create sample if requested
     if args.create_sample:
@@ -220,6 +1313,27 @@ def main():
             return
         args.input = str(sample_path)
 
+    defaults = {
+        'company': args.company,
+        'doc_type': args.doc_type,
+        'watermark': args.watermark,
+        'watermark_text': args.watermark_text,
+        'header': not args.no_header,
+        'footer': not args.no_footer,
+        'accent_bar': not args.no_accent,
+    }
+
+    if args.batch:
+        jobs = collect_batch_jobs(args.batch, args.output_dir, defaults)
+        if not jobs:
+            print(f"Error: No input PDFs found for: {args.batch}")
+            sys.exit(1)
+        with instrument.profiled(args.profile):
+            failures = rebrand_batch(jobs, workers=args.jobs,
+                                     cache_overlays=not args.no_overlay_cache,
+                                     incremental=args.incremental)
+        sys.exit(1 if failures else 0)
+
     if not args.input:
         parser.print_help()
         return
@@ -229,6 +1343,17 @@ def main():
         print(f"Error: Input file not found: {input_path}")
         sys.exit(1)
 
+    if args.brands:
+        brands = collect_brands(args.brands, input_path, args.output_dir, defaults)
+        if not brands:
+            print(f"Error: No branding variants found in: {args.brands}")
+            sys.exit(1)
+        with instrument.profiled(args.profile):
+            failures = rebrand_fanout(input_path, brands, workers=args.jobs,
+                                      cache_overlays=not args.no_overlay_cache,
+                                      incremental=args.incremental)
+        sys.exit(1 if failures else 0)
+
     # Determine output path
     if args.output:
         output_path = Path(args.output)
@@ -236,19 +1361,13 @@ def main():
         output_path = input_path.parent / f"{input_path.stem}_rebranded.pdf"
 
     # Branding configuration
-    branding_config = {
-        'company': args.company,
-        'document_type': args.doc_type,
-        'watermark': args.watermark,
-        'watermark_text': args.watermark_text,
-        'header': not args.no_header,
-        'footer': not args.no_footer,
-        'accent_bar': not args.no_accent,
-        'title': f'{args.doc_type} - {args.company}'
-    }
+    branding_config = make_branding_config(**defaults)
 
     # Rebrand the PDF
-    rebrand_pdf(input_path, output_path, branding_config)
+    with instrument.profiled(args.profile):
+        rebrand_pdf(input_path, output_path, branding_config,
+                    cache_overlays=not args.no_overlay_cache, jobs=args.jobs,
+                    stream=args.stream, incremental=args.incremental)
 
 if __name__ == '__main__':
     main()
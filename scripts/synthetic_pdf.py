@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Synthetic PDF fixtures.
+Generates large test inputs for rebrand_pdf.py with a chosen page count, page
+sizes, image density and font mix. Pages are drawn directly on the ReportLab
+canvas (no Platypus layout), page ranges render in parallel worker processes
+and are then concatenated, and finished fixtures are cached by a hash of
+their parameters.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+# Page geometries as (width, height, /Rotate); 'mixed' cycles through all of them
+PAGE_SIZES = {
+    'letter': ((612, 792, 0),),
+    'a4': ((595, 842, 0),),
+    'legal': ((612, 1008, 0),),
+    'slide': ((960, 540, 0),),
+    'mixed': (
+        (612, 792, 0),      # letter
+        (595, 842, 0),      # A4
+        (612, 1008, 0),     # legal
+        (960, 540, 0),      # 16:9 slide
+        (595, 842, 90),     # A4 scanned sideways, displayed landscape
+        (612, 792, 180),
+        (792, 612, 270),
+    ),
+}
+
+# The PDF standard fonts, usable without embedding
+STANDARD_FONTS = ('Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique', 'Times-Roman',
+                  'Times-Bold', 'Times-Italic', 'Courier', 'Courier-Bold')
+
+WORDS = ('revenue growth market customer platform strategy forecast quarter margin '
+         'pipeline retention expansion enterprise onboarding analytics integration '
+         'roadmap investment operating efficiency partnership adoption benchmark').split()
+
+# Pages per worker task; small enough to spread a few thousand pages over all cores
+CHUNK_PAGES = 250
+
+# Distinct images per worker, reused across its pages like logos and figures in a real deck
+IMAGE_VARIANTS = 4
+
+def fixture_cache_dir():
+    """Where generated fixtures are kept ($SYNTHETIC_PDF_CACHE or ~/.cache/synthetic-pdf)."""
+    return Path(os.environ.get('SYNTHETIC_PDF_CACHE', Path.home() / '.cache' / 'synthetic-pdf'))
+
+def _images(image_px):
+    """``IMAGE_VARIANTS`` deterministic RGB images of ``image_px`` square."""
+    import numpy as np
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+
+    images = []
+    for seed in range(IMAGE_VARIANTS):
+        rng = np.random.default_rng(seed)
+        ramp = np.linspace(0, 255, image_px, dtype=np.uint8)
+        pixels = np.stack(np.broadcast_arrays(ramp[:, None], ramp[None, :],
+                                              rng.integers(0, 256, (image_px, image_px),
+                                                           dtype=np.uint8)), axis=-1)
+        images.append(ImageReader(Image.fromarray(np.ascontiguousarray(pixels))))
+    return images
+
+def images_on_page(page, density):
+    """Images drawn on ``page`` so that pages average ``density`` images each."""
+    return int((page + 1) * density) - int(page * density)
+
+def _render_range(task):
+    """Worker: draw pages ``[start, stop)`` into ``path``."""
+    path, start, stop, sizes, density, fonts, image_px = task
+    from reportlab.pdfgen import canvas
+
+    geometries = PAGE_SIZES[sizes]
+    images = _images(image_px) if density else []
+    can = canvas.Canvas(str(path))
+    for page in range(start, stop):
+        rng = random.Random(page)
+        width, height, rotation = geometries[page % len(geometries)]
+        # ReportLab swaps the media box of quarter-turned pages; pre-swap to keep it as listed
+        can.setPageSize((height, width) if rotation % 180 else (width, height))
+        can.setPageRotation(rotation)
+
+        can.setFont(fonts[0], 18)
+        can.drawString(54, height - 72, f"Section {page // 10 + 1}: Page {page + 1}")
+        text = can.beginText(54, height - 108)
+        for line in range(int((height - 180) // 14)):
+            text.setFont(fonts[line % len(fonts)], 10)
+            text.textLine(' '.join(rng.choice(WORDS) for _ in range(int(width // 60))))
+        can.drawText(text)
+
+        for i in range(images_on_page(page, density)):
+            side = rng.uniform(0.15, 0.3) * min(width, height)
+            can.drawImage(images[(page + i) % len(images)],
+                          rng.uniform(36, width - side - 36), rng.uniform(36, height - side - 36),
+                          side, side)
+        can.showPage()
+    can.save()
+    return path
+
+def generate(path, pages, sizes='letter', images=0.0, fonts=('Helvetica',), jobs=None,
+             image_px=256):
+    """Write a ``pages``-page synthetic PDF to ``path``.
+
+    ``images`` is the average number of images per page, ``fonts`` the
+    standard fonts cycled line by line. Ranges of ``CHUNK_PAGES`` render in
+    ``jobs`` processes (default: all CPUs) and are concatenated; a single
+    process draws straight into ``path``. Each page's content depends only
+    on its number, so the pages are the same whatever ``jobs`` is.
+    """
+    path = Path(path)
+    jobs = min(jobs or os.cpu_count() or 1, -(-pages // CHUNK_PAGES))
+    if jobs <= 1:
+        return _render_range((path, 0, pages, sizes, images, tuple(fonts), image_px))
+
+    from concurrent.futures import ProcessPoolExecutor
+    from PyPDF2 import PdfReader, PdfWriter
+
+    with tempfile.TemporaryDirectory(dir=path.parent) as tmp:
+        tasks = [(Path(tmp) / f'{start:08d}.pdf', start, min(start + CHUNK_PAGES, pages),
+                  sizes, images, tuple(fonts), image_px)
+                 for start in range(0, pages, CHUNK_PAGES)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            parts = list(executor.map(_render_range, tasks))
+
+        writer = PdfWriter()
+        for part in parts:
+            for page in PdfReader(part).pages:
+                writer.add_page(page)
+        with open(path, 'wb') as f:
+            writer.write(f)
+    return path
+
+def fixture_key(pages, sizes, images, fonts, image_px):
+    """Hash of the parameters and this generator's source, naming a cached fixture."""
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(json.dumps([pages, sizes, images, list(fonts), image_px]).encode())
+    return digest.hexdigest()[:16]
+
+def fixture_path(pages, sizes='letter', images=0.0, fonts=('Helvetica',), image_px=256):
+    """Where the fixture with these parameters is (or would be) cached."""
+    key = fixture_key(pages, sizes, images, fonts, image_px)
+    return fixture_cache_dir() / f'synthetic-{pages}p-{key}.pdf'
+
+def fixture(pages, sizes='letter', images=0.0, fonts=('Helvetica',), jobs=None, image_px=256):
+    """Path of a cached synthetic PDF with these parameters, generating it if needed."""
+    path = fixture_path(pages, sizes, images, fonts, image_px)
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Generate under a temporary name so concurrent or interrupted runs never leave half a file
+    tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        generate(tmp, pages, sizes, images, fonts, jobs, image_px)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a large synthetic PDF for testing')
+    parser.add_argument('output', type=Path, help='PDF to write')
+    parser.add_argument('--pages', type=int, default=1000, help='Page count (default: 1000)')
+    parser.add_argument('--sizes', choices=sorted(PAGE_SIZES), default='letter',
+                        help='Page size, or mixed sizes and rotations (default: letter)')
+    parser.add_argument('--images', type=float, default=0.0,
+                        help='Average images per page (default: 0)')
+    parser.add_argument('--image-px', type=int, default=256,
+                        help='Image resolution in pixels (default: 256)')
+    parser.add_argument('--fonts', nargs='+', choices=STANDARD_FONTS, default=['Helvetica'],
+                        help='Standard fonts to cycle through (default: Helvetica)')
+    parser.add_argument('-j', '--jobs', type=int, help='Worker processes (default: all CPUs)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always generate instead of reusing a cached fixture')
+    args = parser.parse_args()
+
+    params = (args.pages, args.sizes, args.images, args.fonts)
+    start = time.perf_counter()
+    if args.no_cache:
+        generate(args.output, *params, jobs=args.jobs, image_px=args.image_px)
+        source = 'generated'
+    else:
+        source = 'cached' if fixture_path(*params, args.image_px).exists() else 'generated'
+        shutil.copyfile(fixture(*params, jobs=args.jobs, image_px=args.image_px), args.output)
+    print(f"✓ {args.output} ({args.pages} pages, {source} in "
+          f"{time.perf_counter() - start:.2f}s)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Watch mode for authoring.
+Keeps Matplotlib and its fonts loaded in one process, polls the forecast,
+document, templates and scripts, and on each change rebuilds only what
+depends on it: the charts whose CSV columns changed, then the PDF.
+"""
+
+import argparse
+import importlib
+import io
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+import build_latex
+import forecast
+import generate_charts
+import instrument
+
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_DIR = SCRIPT_DIR.parent
+
+TUFTE_TEX = PROJECT_DIR / 'business-plan-tufte.tex'
+INPUT_MD = PROJECT_DIR / 'plan.md'
+TEMPLATE = PROJECT_DIR / 'templates' / 'modern-template.tex'
+OUTPUT_PDF = PROJECT_DIR / 'business-plan.pdf'
+
+# Reloaded in this order when a script changes, so each sees its dependencies' new code
+RELOAD_ORDER = (instrument, forecast, generate_charts, build_latex)
+
+def watched_files(data_file):
+    """Every source file whose edits trigger a rebuild (generated charts are not watched)."""
+    files = {data_file, INPUT_MD, TUFTE_TEX}
+    files.update(p for p in PROJECT_DIR.iterdir()
+                 if p.is_file() and p.suffix in build_latex.CLASS_SUFFIXES)
+    for directory, pattern in ((PROJECT_DIR / 'templates', '*'), (PROJECT_DIR / 'assets', '*'),
+                               (SCRIPT_DIR, '*.py'), (SCRIPT_DIR, '*.mplstyle')):
+        files.update(p for p in directory.glob(pattern) if p.is_file())
+    return files
+
+def snapshot(files):
+    """Modification time of each file that exists."""
+    mtimes = {}
+    for path in files:
+        try:
+            mtimes[path] = path.stat().st_mtime_ns
+        except OSError:
+            pass
+    return mtimes
+
+def changed_columns(old, new):
+    """Columns whose values differ between two loads of the forecast.
+
+    A change of shape or column set counts as every column changing.
+    """
+    if old is None or list(old.columns) != list(new.columns) or len(old) != len(new):
+        return set(new.columns)
+    return {column for column in new.columns if not old[column].equals(new[column])}
+
+def affected_charts(columns):
+    """Charts that read any of ``columns``; scenario edits affect them all."""
+    if forecast.SCENARIO_COLUMN in columns:
+        return list(generate_charts.CHARTS)
+    return [name for name, (_, reads) in generate_charts.CHARTS.items()
+            if columns.intersection(reads)]
+
+def warm_up(df):
+    """Render the first chart to memory so fonts, the PDF backend and its template are loaded."""
+    derived = forecast.derive_series(df)
+    summary = forecast.scenario_summary(derived)
+    _, frame, row = next(forecast.iter_scenarios(derived, summary))
+    name = next(iter(generate_charts.CHARTS))
+    generate_charts.chart_template(name).update(frame, row).savefig(io.BytesIO(), format='pdf')
+
+def reload_scripts():
+    """Re-import the build modules so edits to them take effect without a restart."""
+    for module in RELOAD_ORDER:
+        importlib.reload(module)
+    # A reload keeps module globals, so Matplotlib stays loaded; re-apply the style sheet
+    matplotlib = generate_charts.matplotlib
+    matplotlib.rcdefaults()
+    matplotlib.style.use(generate_charts.STYLE_SHEET)
+
+def build_document():
+    """Rebuild the PDF the way build.sh does; the LaTeX build skips unchanged inputs."""
+    if TUFTE_TEX.exists():
+        if shutil.which('pdflatex') is None:
+            print("  (pdflatex not found - charts only)")
+            return
+        pdf = build_latex.build_latex(TUFTE_TEX)
+        if pdf:
+            shutil.copyfile(pdf, OUTPUT_PDF)
+        return
+    if shutil.which('pandoc') is None:
+        print("  (pandoc not found - charts only)")
+        return
+    subprocess.run(['pandoc', str(INPUT_MD), '--from', 'markdown+yaml_metadata_block',
+                    '--to', 'pdf', '--output', str(OUTPUT_PDF), f'--template={TEMPLATE}',
+                    '--pdf-engine=xelatex', '--toc', '--number-sections'],
+                   cwd=PROJECT_DIR, stderr=subprocess.DEVNULL)
+
+def rebuild(args, changed, previous):
+    """Rebuild what ``changed`` paths affect; returns the forecast as now loaded."""
+    df = forecast.load_forecast(args.data)
+    if any(path.parent == SCRIPT_DIR for path in changed):
+        print("Scripts changed - reloading")
+        reload_scripts()
+        # Chart fingerprints include their code and forecast.py, so only charts an edit touches re-render
+        names = list(generate_charts.CHARTS)
+    elif args.data in changed:
+        columns = changed_columns(previous, df)
+        names = affected_charts(columns)
+        print(f"Columns changed: {', '.join(sorted(columns)) or 'none'} -> "
+              f"charts: {', '.join(names) or 'none'}")
+    else:
+        names = []
+
+    if names:
+        generate_charts.build_charts(args, PROJECT_DIR / 'charts', names)
+    if not args.no_pdf:
+        build_document()
+    return df
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild charts and the PDF as sources change')
+    parser.add_argument('--data', type=Path, default=PROJECT_DIR / 'data' / 'forecast.csv',
+                        help='Forecast CSV to watch (default: data/forecast.csv)')
+    parser.add_argument('--interval', type=float, default=0.5,
+                        help='Seconds between checks for changes (default: 0.5)')
+    parser.add_argument('--formats', nargs='+', default=['pdf'], choices=['pdf', 'svg', 'png'],
+                        help='Chart formats to write (default: pdf)')
+    parser.add_argument('--rasterize', action='store_true',
+                        help='Draw fill areas and gradients as bitmaps')
+    parser.add_argument('--fixed-layout', action='store_true',
+                        help='Use precomputed chart margins instead of tight_layout')
+    parser.add_argument('--no-pdf', action='store_true',
+                        help='Only rebuild charts, not the document')
+    args = parser.parse_args()
+    args.data = args.data.resolve()
+    # build_charts options that watch mode does not expose
+    args.force, args.jobs = False, 1
+
+    print("Loading Matplotlib and fonts...")
+    start = time.perf_counter()
+    generate_charts._load_plotting()
+    if args.fixed_layout:
+        generate_charts.warm_fonts()
+    df = forecast.load_forecast(args.data)
+    warm_up(df)
+    print(f"✓ Ready in {time.perf_counter() - start:.1f}s")
+
+    # Bring everything up to date once, then react to edits
+    generate_charts.build_charts(args, PROJECT_DIR / 'charts')
+    if not args.no_pdf:
+        build_document()
+
+    mtimes = snapshot(watched_files(args.data))
+    print(f"\nWatching {len(mtimes)} files (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(args.interval)
+            current = snapshot(watched_files(args.data))
+            if current == mtimes:
+                continue
+            # Let editors finish writing before reading anything
+            time.sleep(args.interval)
+            current = snapshot(watched_files(args.data))
+            changed = {path for path in current.keys() | mtimes.keys()
+                       if current.get(path) != mtimes.get(path)}
+            mtimes = current
+            print(f"\nChanged: {', '.join(sorted(p.name for p in changed))}")
+            start = time.perf_counter()
+            try:
+                df = rebuild(args, changed, df)
+            except Exception as e:
+                # Keep watching through half-finished edits (syntax errors, bad CSV rows)
+                print(f"✗ Rebuild failed: {e}")
+                continue
+            print(f"✓ Rebuilt in {time.perf_counter() - start:.2f}s")
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+
+if __name__ == '__main__':
+    main()